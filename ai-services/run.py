@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Entry point for the AI services application."""
 
+import logging
 import sys
 import os
 from pathlib import Path
@@ -10,26 +11,71 @@ current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
 # Now we can import from src
-from src.main import app
+from src.config import get_settings
 import uvicorn
 
-if __name__ == "__main__":
-    print(f"""
+logger = logging.getLogger(__name__)
+
+# Formatted lazily by logging, so nothing is built unless INFO is enabled
+BANNER = """
 🐍 Veltris Codex AI Services Starting!
 
-📡 Server:     http://0.0.0.0:8000
-🔧 Health:     http://0.0.0.0:8000/api/health
-🤖 Models:     http://0.0.0.0:8000/api/models
-💬 Chat:       http://0.0.0.0:8000/api/chat
-📚 Docs:       http://0.0.0.0:8000/docs
-
-🌍 Environment: {os.getenv('ENVIRONMENT', 'development')}
-    """)
-    
-    uvicorn.run(
-        "src.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+📡 Server:     http://%(host)s:%(port)s
+🔧 Health:     http://%(host)s:%(port)s/api/health
+🤖 Models:     http://%(host)s:%(port)s/api/models
+💬 Chat:       http://%(host)s:%(port)s/api/chat
+📚 Docs:       http://%(host)s:%(port)s/docs
+
+🌍 Environment: %(environment)s
+"""
+
+if __name__ == "__main__":
+    settings = get_settings()
+    logging.basicConfig(level=settings.log_level.upper(), format="%(message)s")
+    logger.info(
+        BANNER,
+        {"host": settings.host, "port": settings.port, "environment": settings.environment},
+    )
+
+    if settings.is_development:
+        # Single worker with auto-reload for local development. The reload
+        # watcher runs the server in a subprocess where uvloop is not
+        # guaranteed to be used, so this path must never serve production.
+        # Uvicorn picks the event-driven WatchFiles reloader when watchfiles is
+        # installed; only src/ is watched so venvs and node_modules are skipped.
+        # loop="uvloop" selects the event loop in the server process itself.
+        uvicorn.run(
+            "src.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=True,
+            reload_dirs=[str(current_dir / "src")],
+            reload_includes=["*.py"],
+            reload_delay=0.25,
+            workers=1,
+            log_level=settings.log_level.lower(),
+            loop="uvloop",
+            http="httptools",
+            ws="websockets",
+        )
+    else:
+        # Production: hand the process over to Gunicorn managing 2*N+1 uvicorn
+        # workers so one slow LLM call cannot block every other connection.
+        # --preload imports the app once in the master so module-level state
+        # (settings, built Pydantic schemas, prompt and frame constants) is
+        # shared copy-on-write. Providers and their HTTP clients hold
+        # event-loop resources, so each worker creates them in the lifespan.
+        workers = 2 * (os.cpu_count() or 1) + 1
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                "src.main:app",
+                "-k", "uvicorn.workers.UvicornWorker",
+                "-w", str(workers),
+                "--bind", f"{settings.host}:{settings.port}",
+                "--keep-alive", "30",
+                "--timeout", str(settings.request_timeout),
+                "--preload",
+            ],
+        )
@@ -1,10 +1,14 @@
 """Configuration management for AI services."""
+import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+logger = logging.getLogger(__name__)
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -22,16 +26,24 @@ class Settings(BaseSettings):
     max_tokens: int = Field(default=4000, env="MAX_TOKENS")
     temperature: float = Field(default=0.7, env="TEMPERATURE")
     request_timeout: int = Field(default=300, env="REQUEST_TIMEOUT")
+    openai_max_concurrency: int = Field(default=8, env="OPENAI_MAX_CONCURRENCY")
     
     # Ollama Configuration
     ollama_base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
     ollama_model: str = Field(default="gpt-oss:latest", env="OLLAMA_MODEL")
     ollama_timeout: int = Field(default=120, env="OLLAMA_TIMEOUT")
+    ollama_max_concurrency: int = Field(default=1, env="OLLAMA_MAX_CONCURRENCY")
     
     # Gateway Communication
     gateway_url: str = Field(default="http://localhost:3001", env="GATEWAY_URL")
     gateway_secret: Optional[str] = Field(default=None, env="GATEWAY_SECRET")
     
+    # Response cache (in-process when unset)
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
+    
+    # Chat reply cache TTL in seconds (disabled when 0)
+    chat_cache_ttl: int = Field(default=0, env="CHAT_CACHE_TTL")
+    
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_format: str = Field(default="json", env="LOG_FORMAT")
@@ -47,15 +59,11 @@ class Settings(BaseSettings):
                 "At least one AI API key (OPENAI_API_KEY or ANTHROPIC_API_KEY) must be provided"
             )
         
-        if self.openai_api_key:
-            print("✅ OpenAI API key configured")
-        else:
-            print("⚠️  OpenAI API key not configured")
-            
-        if self.anthropic_api_key:
-            print("✅ Anthropic API key configured")
-        else:
-            print("⚠️  Anthropic API key not configured")
+        logger.info(
+            "AI keys configured: openai=%s anthropic=%s",
+            bool(self.openai_api_key),
+            bool(self.anthropic_api_key),
+        )
 
     @property
     def is_development(self) -> bool:
@@ -68,15 +76,17 @@ class Settings(BaseSettings):
         return self.environment.lower() == "production"
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance, parsing the environment on first use."""
+    settings = Settings()
+
+    # Validate configuration on first use
+    try:
+        settings.validate_ai_keys()
+    except ValueError:
+        if settings.is_production:
+            raise
+        logger.warning("Configuration error; continuing in development mode", exc_info=True)
 
-# Validate configuration on import
-try:
-    settings.validate_ai_keys()
-except ValueError as e:
-    print(f"❌ Configuration error: {e}")
-    if settings.is_production:
-        raise
-    else:
-        print("⚠️  Continuing in development mode...")
\ No newline at end of file
+    return settings
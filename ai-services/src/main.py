@@ -1,17 +1,35 @@
 """Main FastAPI application for AI services."""
-import uvicorn
-from fastapi import FastAPI
+import hashlib
+import re
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.config import settings
+from src.config import get_settings
+from src.middleware import JSONGZipMiddleware
 from src.routes.chat import router as chat_router
 from src.routes.files import router as files_router
 from src.routes.models import router as models_router
-from src.services.providers.openai_provider import OpenAIProvider
-from src.services.providers.claude_provider import ClaudeProvider
-from src.services.providers.ollama_provider import OllamaProvider
-from src.services.tool_executor import ToolExecutor
-import src.services.tool_executor as tool_executor_module
+from src.services.http_client import close_async_http_client
+from src.services.response_cache import init_response_cache
+from src.services.providers.ollama_provider import get_ollama_provider
+from src.services.tool_executor import get_tool_executor
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the shared providers and tool executor once per worker."""
+    get_ollama_provider()
+    get_tool_executor()  # Also builds the OpenAI and Claude providers
+    init_response_cache(settings)
+    yield
+    await get_ollama_provider().close()
+    await close_async_http_client()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -20,68 +38,70 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Middleware rules:
+# - Only pure-ASGI middleware may be added here. Never subclass
+#   BaseHTTPMiddleware (or use @app.middleware("http")): it spawns extra tasks
+#   per request and wraps streaming bodies, costing most of our throughput.
+# - Observability/auth middleware must be written as a plain ASGI callable:
+#   ``async def __call__(self, scope, receive, send): await self.app(scope, receive, send)``
+# - Keep CORS methods/headers as concrete lists so Starlette builds the joined
+#   header values once in __init__ instead of mirroring request headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure based on your needs
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "Cache-Control"],
+)
+# Compress JSON (model listings, OpenAPI schema); never the SSE chat stream
+app.add_middleware(
+    JSONGZipMiddleware,
+    exclude_paths=["/api/chat"],
+    minimum_size=500,
+    compresslevel=5,
 )
-
-# Initialize providers
-openai_provider_instance = OpenAIProvider() if settings.openai_api_key else None
-claude_provider_instance = ClaudeProvider() if settings.anthropic_api_key else None
-ollama_provider_instance = OllamaProvider()  # Always available if Ollama service is running
-
-# Initialize tool executor with providers and set global instance
-tool_executor_instance = ToolExecutor(openai_provider_instance, claude_provider_instance)
-tool_executor_module.tool_executor = tool_executor_instance
 
 # Include routers
 app.include_router(chat_router, prefix="/api")
 app.include_router(files_router, prefix="/api")
 app.include_router(models_router, prefix="/api")
 
-# Root endpoint
-@app.get("/")
-async def root():
-    """Root endpoint with service information."""
-    return {
-        "service": "Veltris Codex AI Services",
-        "version": "1.0.0",
-        "description": "Python-based AI services for code generation, analysis, and documentation",
-        "status": "healthy",
-        "endpoints": {
-            "chat": "/api/chat",
-            "models": "/api/models",
-            "health": "/api/health"
-        },
-        "docs": "/docs" if settings.is_development else None
-    }
+# Root payload only depends on boot-time settings, so serialize it once
+_ROOT_BYTES = orjson.dumps({
+    "service": "Veltris Codex AI Services",
+    "version": "1.0.0",
+    "description": "Python-based AI services for code generation, analysis, and documentation",
+    "status": "healthy",
+    "endpoints": {
+        "chat": "/api/chat",
+        "models": "/api/models",
+        "health": "/api/health"
+    },
+    "docs": "/docs" if settings.is_development else None
+})
+_ROOT_ETAG = f'"{hashlib.md5(_ROOT_BYTES, usedforsecurity=False).hexdigest()}"'
 
+# One entity-tag of an If-None-Match list, optionally weak, or the "*" wildcard
+_ENTITY_TAG_RE = re.compile(r'\*|(?:W/)?("[^"]*")')
 
-if __name__ == "__main__":
-    print(f"""
-🐍 Veltris Codex AI Services Starting!
 
-📡 Server:     http://{settings.host}:{settings.port}
-🔧 Health:     http://{settings.host}:{settings.port}/api/health
-🤖 Models:     http://{settings.host}:{settings.port}/api/models
-💬 Chat:       http://{settings.host}:{settings.port}/api/chat
-📚 Docs:       http://{settings.host}:{settings.port}/docs
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weakly compare an If-None-Match header against an ETag (RFC 9110, 13.1.2)."""
+    for match in _ENTITY_TAG_RE.finditer(if_none_match):
+        if match.group(1) is None or match.group(1) == etag:
+            return True
+    return False
 
-🌍 Environment: {settings.environment}
-🔥 Temperature: {settings.temperature}
-🎯 Max Tokens: {settings.max_tokens}
-    """)
-    
-    uvicorn.run(
-        "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.is_development,
-        log_level=settings.log_level.lower()
-    )
+
+# Root endpoint
+@app.get("/")
+async def root(request: Request):
+    """Root endpoint with service information."""
+    headers = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=60"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, _ROOT_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(_ROOT_BYTES, media_type="application/json", headers=headers)
@@ -0,0 +1,31 @@
+"""Pure-ASGI middleware for the AI services app."""
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class JSONGZipMiddleware:
+    """GZip JSON responses while passing streaming routes through untouched.
+
+    Older Starlette releases buffer ``text/event-stream`` bodies inside the
+    gzip writer, which would hold SSE tokens back, so those paths bypass
+    compression entirely.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: Iterable[str] = (),
+        minimum_size: int = 500,
+        compresslevel: int = 5,
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] not in self.exclude_paths:
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
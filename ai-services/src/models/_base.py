@@ -0,0 +1,23 @@
+"""Shared base classes for the Pydantic models."""
+from pydantic import BaseModel, ConfigDict
+
+from src.config import get_settings
+
+
+class FrozenBase(BaseModel):
+    """Immutable base for tool parameter and result models, which are never mutated after validation."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+def rebuild_models(*models: type[BaseModel]) -> None:
+    """Build the validator/serializer schemas once at import time.
+
+    Outside development the OpenAPI docs are disabled, so field descriptions
+    are dropped first to keep them out of every worker's schemas.
+    """
+    strip_descriptions = not get_settings().is_development
+    for model in models:
+        if strip_descriptions:
+            for field in model.model_fields.values():
+                field.description = None
+        model.model_rebuild(force=True)
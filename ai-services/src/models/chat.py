@@ -1,11 +1,13 @@
 """Chat-related models."""
-from enum import Enum
+from enum import StrEnum
 from typing import Dict, List, Optional, Any
 
 from pydantic import BaseModel, Field
 
+from src.models._base import rebuild_models
 
-class AIModel(str, Enum):
+
+class AIModel(StrEnum):
     """Supported AI models."""
     GPT_4O = "gpt-4o"
     CLAUDE_3_5_SONNET = "claude-3.5-sonnet"
@@ -51,4 +53,8 @@ class HealthStatus(BaseModel):
     version: str = Field(..., description="Service version")
     uptime: int = Field(..., description="Uptime in seconds")
     models: Dict[str, bool] = Field(..., description="Model availability")
-    timestamp: int = Field(..., description="Status timestamp")
\ No newline at end of file
+    timestamp: int = Field(..., description="Status timestamp")
+
+
+# Build the validator/serializer schemas once at import time
+rebuild_models(ChatContext, ToolCall, ChatRequest, ModelInfo, HealthStatus)
@@ -1,11 +1,16 @@
 """Streaming response models."""
-from enum import Enum
-from typing import Any, Dict, Optional, Union
+import time
+from enum import StrEnum
+from typing import Annotated, Any, Dict, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
+from src.models._base import rebuild_models
 
-class StreamChunkType(str, Enum):
+
+class StreamChunkType(StrEnum):
     """Types of streaming chunks."""
     AI_CHUNK = "ai_chunk"
     TOOL_STATUS = "tool_status"
@@ -14,7 +19,7 @@ class StreamChunkType(str, Enum):
     ERROR = "error"
 
 
-class ToolStatus(str, Enum):
+class ToolStatus(StrEnum):
     """Tool execution status."""
     EXECUTING = "executing"
     COMPLETED = "completed"
@@ -29,34 +34,122 @@ class StreamChunk(BaseModel):
 
 class AIChunk(StreamChunk):
     """AI response chunk."""
-    type: StreamChunkType = StreamChunkType.AI_CHUNK
+    type: Literal[StreamChunkType.AI_CHUNK] = StreamChunkType.AI_CHUNK
     content: str = Field(..., description="AI response content")
 
 
 class ToolStatusChunk(StreamChunk):
     """Tool execution status chunk."""
-    type: StreamChunkType = StreamChunkType.TOOL_STATUS
+    type: Literal[StreamChunkType.TOOL_STATUS] = StreamChunkType.TOOL_STATUS
     tool: str = Field(..., description="Tool name")
     status: ToolStatus = Field(..., description="Tool execution status")
 
 
 class ToolResultChunk(StreamChunk):
     """Tool execution result chunk."""
-    type: StreamChunkType = StreamChunkType.TOOL_RESULT
+    type: Literal[StreamChunkType.TOOL_RESULT] = StreamChunkType.TOOL_RESULT
     tool: str = Field(..., description="Tool name")
     result: Any = Field(..., description="Tool execution result")
 
 
 class DoneChunk(StreamChunk):
     """Stream completion chunk."""
-    type: StreamChunkType = StreamChunkType.DONE
+    type: Literal[StreamChunkType.DONE] = StreamChunkType.DONE
 
 
 class ErrorChunk(StreamChunk):
     """Error chunk."""
-    type: StreamChunkType = StreamChunkType.ERROR
+    type: Literal[StreamChunkType.ERROR] = StreamChunkType.ERROR
     error: str = Field(..., description="Error message")
 
 
-# Union type for all possible stream chunks
-StreamMessage = Union[AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk]
\ No newline at end of file
+# Build the validator/serializer schemas once at import time
+rebuild_models(StreamChunk, AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk)
+
+
+# Union type for all possible stream chunks, discriminated on ``type``
+StreamMessage = Annotated[
+    Union[AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk],
+    Field(discriminator="type"),
+]
+
+
+# Plain-dict payloads for the emit side. Chunks built internally are trusted,
+# so the hot streaming path skips model instantiation and validation and
+# serializes these straight through the Rust serializer.
+class AIChunkPayload(TypedDict):
+    """AI response chunk payload."""
+    type: Literal[StreamChunkType.AI_CHUNK]
+    content: str
+    timestamp: Optional[int]
+
+
+class ToolStatusPayload(TypedDict):
+    """Tool execution status chunk payload."""
+    type: Literal[StreamChunkType.TOOL_STATUS]
+    tool: str
+    status: ToolStatus
+    timestamp: Optional[int]
+
+
+class ToolResultPayload(TypedDict):
+    """Tool execution result chunk payload."""
+    type: Literal[StreamChunkType.TOOL_RESULT]
+    tool: str
+    result: Any
+    timestamp: Optional[int]
+
+
+class DonePayload(TypedDict):
+    """Stream completion chunk payload."""
+    type: Literal[StreamChunkType.DONE]
+    timestamp: Optional[int]
+
+
+class ErrorPayload(TypedDict):
+    """Error chunk payload."""
+    type: Literal[StreamChunkType.ERROR]
+    error: str
+    timestamp: Optional[int]
+
+
+# Serializer singletons: ``AI_CHUNK_DUMP(payload) -> bytes``
+AI_CHUNK_DUMP = TypeAdapter(AIChunkPayload).dump_json
+TOOL_STATUS_DUMP = TypeAdapter(ToolStatusPayload).dump_json
+TOOL_RESULT_DUMP = TypeAdapter(ToolResultPayload).dump_json
+DONE_DUMP = TypeAdapter(DonePayload).dump_json
+ERROR_DUMP = TypeAdapter(ErrorPayload).dump_json
+
+
+def now_ms() -> int:
+    """Wall-clock chunk timestamp in milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+# SSE framing: ``data: <json>\n\n``
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+
+def frame(chunk_bytes: bytes) -> bytes:
+    """Wrap serialized chunk bytes in an SSE ``data:`` frame."""
+    return SSE_PREFIX + chunk_bytes + SSE_SUFFIX
+
+
+# Tool status frames differ only in tool name, status and timestamp, so they
+# are spliced from prebuilt byte segments instead of being serialized
+_TOOL_STATUS_HEAD = SSE_PREFIX + b'{"type":"tool_status","tool":'
+_TOOL_STATUS_MIDDLE = {
+    status: b',"status":' + orjson.dumps(status.value) + b',"timestamp":'
+    for status in ToolStatus
+}
+_FRAME_TAIL = b"}" + SSE_SUFFIX
+
+
+def tool_status_frame(tool: str, status: ToolStatus, timestamp: int) -> bytes:
+    """Build a tool status SSE frame; equivalent to ``frame(TOOL_STATUS_DUMP(...))``."""
+    return _TOOL_STATUS_HEAD + orjson.dumps(tool) + _TOOL_STATUS_MIDDLE[status] + str(timestamp).encode() + _FRAME_TAIL
+
+
+# The completion frame carries no per-stream data, so build it once
+DONE_FRAME = frame(DONE_DUMP({"type": StreamChunkType.DONE, "timestamp": None}))
@@ -1,11 +1,13 @@
 """Tool-related models."""
-from enum import Enum
+from enum import StrEnum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.models._base import FrozenBase, rebuild_models
 
-class DocType(str, Enum):
+
+class DocType(StrEnum):
     """Documentation types."""
     BRD = "BRD"
     SRD = "SRD"
@@ -13,7 +15,7 @@ class DocType(str, Enum):
     API_DOCS = "API_DOCS"
 
 
-class RefactorType(str, Enum):
+class RefactorType(StrEnum):
     """Code refactoring types."""
     OPTIMIZE = "optimize"
     MODERNIZE = "modernize"
@@ -22,87 +24,98 @@ class RefactorType(str, Enum):
 
 
 # Tool Parameter Models
-class CodeDiffParams(BaseModel):
+class CodeDiffParams(FrozenBase):
     """Parameters for code diff generation."""
     old_code: str = Field(..., description="Original version of the code")
     new_code: str = Field(..., description="Updated version of the code")
     language: Optional[str] = Field(default=None, description="Programming language")
 
 
-class DocumentationParams(BaseModel):
+class DocumentationParams(FrozenBase):
     """Parameters for documentation generation."""
     doc_type: DocType = Field(..., description="Type of documentation to generate")
     project_context: str = Field(..., description="Project context and description")
     code_structure: Optional[str] = Field(default=None, description="Code structure info")
 
 
-class MultiDocumentationParams(BaseModel):
+class MultiDocumentationParams(FrozenBase):
     """Parameters for multiple documentation generation."""
-    doc_types: List[DocType] = Field(..., min_items=1, description="Types of documentation to generate")
+    doc_types: List[DocType] = Field(..., min_length=1, description="Types of documentation to generate")
     project_context: str = Field(..., description="Project context and description")
     code_structure: Optional[str] = Field(default=None, description="Code structure info")
 
 
-class CodeAnalysisParams(BaseModel):
+class CodeAnalysisParams(FrozenBase):
     """Parameters for code analysis."""
     file_path: str = Field(..., description="File path being analyzed")
     code_content: str = Field(..., description="Code content to analyze")
 
 
-class RefactorParams(BaseModel):
+class RefactorParams(FrozenBase):
     """Parameters for code refactoring."""
     original_code: str = Field(..., description="Original code to refactor")
     refactor_type: RefactorType = Field(..., description="Type of refactoring")
 
 
-class FileModificationParams(BaseModel):
+class FileModificationParams(FrozenBase):
     """Parameters for file modification with diff preview."""
     file_path: str = Field(..., description="Path to the file to modify")
     modification_request: str = Field(..., description="Description of the changes to make")
     current_content: Optional[str] = Field(default=None, description="Current file content (auto-fetched if not provided)")
 
 
-class GenerateCodeParams(BaseModel):
-    """Parameters for code generation."""
-    prompt: str = Field(..., description="Natural language description of the code to generate")
-    file_path: Optional[str] = Field(default=None, description="Suggested file path for the generated code")
-    language: Optional[str] = Field(default=None, description="Programming language of the code to generate")
-
-
-class CodeGenerationItem(BaseModel):
+class CodeGenerationItem(FrozenBase):
     """Represents a single code generation request within a multi-file operation."""
     prompt: str = Field(..., description="Natural language description of the code to generate for this item")
     file_path: str = Field(..., description="The specific file path (relative to project root) where this code should be saved")
     language: Optional[str] = Field(default=None, description="Programming language for this code item")
 
 
-class GenerateCodeParams(BaseModel):
+class MultiGenerateCodeParams(FrozenBase):
     """Parameters for multi-file code generation."""
     items: List[CodeGenerationItem] = Field(..., description="A list of code generation requests, each specifying a prompt, file path, and optional language.")
 
 
+class ListDirectoryParams(FrozenBase):
+    """Parameters for listing a directory tree."""
+    path: str = Field(default=".", description="Directory to list")
+
+
+class ReadFileParams(FrozenBase):
+    """Parameters for reading a file."""
+    absolute_path: str = Field(..., description="Path of the file to read")
+    base_path: Optional[str] = Field(default=None, description="Working directory the path must stay inside")
+
+
+class WriteFileParams(FrozenBase):
+    """Parameters for writing a file."""
+    file_path: str = Field(..., description="Path of the file to write")
+    content: str = Field(..., description="Content to write to the file")
+    base_path: Optional[str] = Field(default=None, description="Working directory the path must stay inside")
+
+
 # Tool Result Models
-class DiffLine(BaseModel):
+class DiffLine(FrozenBase):
     """Single diff line."""
     type: str = Field(..., description="Change type: added, removed, unchanged")
     content: str = Field(..., description="Line content")
     line_number: int = Field(..., description="Line number")
 
 
-class DiffSummary(BaseModel):
+class DiffSummary(FrozenBase):
     """Diff summary statistics."""
     lines_added: int = Field(..., description="Number of added lines")
     lines_removed: int = Field(..., description="Number of removed lines")
     lines_changed: int = Field(..., description="Number of changed lines")
 
 
-class CodeDiffResult(BaseModel):
+class CodeDiffResult(FrozenBase):
     """Code diff result."""
     diffs: List[DiffLine] = Field(..., description="Line-by-line differences")
     summary: DiffSummary = Field(..., description="Diff summary")
 
 
-class DocumentationResult(BaseModel):
+class DocumentationResult(FrozenBase):
     """Documentation generation result."""
     content: str = Field(..., description="Generated documentation content")
     doc_type: str = Field(..., description="Documentation type")
@@ -110,7 +123,7 @@ class DocumentationResult(BaseModel):
     word_count: int = Field(..., description="Word count")
 
 
-class FileModificationResult(BaseModel):
+class FileModificationResult(FrozenBase):
     """File modification result with diff."""
     file_path: str = Field(..., description="Path to the modified file")
     original_content: str = Field(..., description="Original file content")
@@ -119,7 +132,7 @@ class FileModificationResult(BaseModel):
     modification_summary: str = Field(..., description="Summary of changes made")
 
 
-class CodeStructure(BaseModel):
+class CodeStructure(FrozenBase):
     """Code structure analysis."""
     functions: List[str] = Field(..., description="Found functions")
     classes: List[str] = Field(..., description="Found classes")
@@ -127,14 +140,14 @@ class CodeStructure(BaseModel):
     exports: List[str] = Field(..., description="Found exports")
 
 
-class CodeMetrics(BaseModel):
+class CodeMetrics(FrozenBase):
     """Code quality metrics."""
     lines_of_code: int = Field(..., description="Lines of code")
     complexity: int = Field(..., description="Cyclomatic complexity")
     maintainability_score: float = Field(..., description="Maintainability score")
 
 
-class CodeAnalysisResult(BaseModel):
+class CodeAnalysisResult(FrozenBase):
     """Code analysis result."""
     structure: CodeStructure = Field(..., description="Code structure")
     metrics: CodeMetrics = Field(..., description="Code metrics")
@@ -142,16 +155,69 @@ class CodeAnalysisResult(BaseModel):
     patterns: List[str] = Field(..., description="Detected patterns")
 
 
-class RefactorChange(BaseModel):
+class RefactorChange(FrozenBase):
     """Single refactor change."""
     type: str = Field(..., description="Change type")
     description: str = Field(..., description="Change description")
     line_number: int = Field(..., description="Line number")
 
 
-class RefactorResult(BaseModel):
+class RefactorResult(FrozenBase):
     """Code refactoring result."""
     refactored_code: str = Field(..., description="Refactored code")
     changes: List[RefactorChange] = Field(..., description="Applied changes")
     improvements: List[str] = Field(..., description="Improvements made")
-    refactor_type: str = Field(..., description="Type of refactoring applied")
\ No newline at end of file
+    refactor_type: str = Field(..., description="Type of refactoring applied")
+
+
+# Build the validator/serializer schemas once at import time
+rebuild_models(
+    CodeDiffParams,
+    DocumentationParams,
+    MultiDocumentationParams,
+    CodeAnalysisParams,
+    RefactorParams,
+    FileModificationParams,
+    CodeGenerationItem,
+    MultiGenerateCodeParams,
+    ListDirectoryParams,
+    ReadFileParams,
+    WriteFileParams,
+    DiffLine,
+    DiffSummary,
+    CodeDiffResult,
+    DocumentationResult,
+    FileModificationResult,
+    CodeStructure,
+    CodeMetrics,
+    CodeAnalysisResult,
+    RefactorChange,
+    RefactorResult,
+)
+
+
+__all__ = [
+    "DocType",
+    "RefactorType",
+    "CodeDiffParams",
+    "DocumentationParams",
+    "MultiDocumentationParams",
+    "CodeAnalysisParams",
+    "RefactorParams",
+    "FileModificationParams",
+    "CodeGenerationItem",
+    "MultiGenerateCodeParams",
+    "ListDirectoryParams",
+    "ReadFileParams",
+    "WriteFileParams",
+    "DiffLine",
+    "DiffSummary",
+    "CodeDiffResult",
+    "DocumentationResult",
+    "FileModificationResult",
+    "CodeStructure",
+    "CodeMetrics",
+    "CodeAnalysisResult",
+    "RefactorChange",
+    "RefactorResult",
+]
@@ -1,143 +1,176 @@
 """Chat route for AI services."""
 import asyncio
-import json
-from typing import Optional
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi_cache.decorator import cache
 
-from src.config import settings
 from src.models.chat import ChatRequest, AIModel
-from src.services.providers.openai_provider import openai_provider
-from src.services.providers.claude_provider import claude_provider
-from src.services.providers.ollama_provider import ollama_provider
-from src.services.tool_executor import get_tool_executor
-from src.models.streaming import ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk
+from src.routes.sse import EventStreamResponse
+from src.services.chat_cache import ChatResponseCache, get_chat_cache
+from src.services.providers.openai_provider import OpenAIProvider, get_openai_provider
+from src.services.providers.claude_provider import ClaudeProvider, get_claude_provider
+from src.services.providers.ollama_provider import get_ollama_provider
+from src.services.tool_executor import ToolExecutor, get_tool_executor
+from src.models.streaming import (
+    StreamChunkType,
+    ToolStatus,
+    AI_CHUNK_DUMP,
+    TOOL_RESULT_DUMP,
+    DONE_FRAME,
+    ERROR_DUMP,
+    frame,
+    now_ms,
+    tool_status_frame,
+)
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+class ProviderEntry(NamedTuple):
+    """Provider registered for a chat model."""
+    provider: Optional[Any]
+    health_check: Optional[Callable[[], Awaitable[bool]]]
+    unavailable_detail: str
+    unreachable_detail: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def get_provider_registry() -> Dict[AIModel, ProviderEntry]:
+    """Get the model -> provider dispatch table, built once from the shared providers."""
+    ollama_provider = get_ollama_provider()
+    return {
+        AIModel.GPT_4O: ProviderEntry(
+            get_openai_provider(),
+            None,
+            "OpenAI service not available (API key not configured)",
+        ),
+        AIModel.CLAUDE_3_5_SONNET: ProviderEntry(
+            get_claude_provider(),
+            None,
+            "Claude service not available (API key not configured)",
+        ),
+        AIModel.GPT_OSS: ProviderEntry(
+            ollama_provider,
+            ollama_provider.check_health,
+            "Ollama service not available (service not running)",
+            "Ollama service not available (cannot connect to localhost:11434)",
+        ),
+    }
+
+
 @router.post("/chat")
-async def stream_chat(request: ChatRequest):
+async def stream_chat(
+    request: ChatRequest,
+    providers: Dict[AIModel, ProviderEntry] = Depends(get_provider_registry),
+    tool_executor: ToolExecutor = Depends(get_tool_executor),
+    chat_cache: Optional[ChatResponseCache] = Depends(get_chat_cache),
+):
     """Stream AI chat response."""
-    print(f"DEBUG: Chat request received - Message: {request.message}")
-    print(f"DEBUG: Chat request context: {request.context}")
+    logger.debug("Chat request: message=%s context=%s", request.message, request.context)
     
     # Select provider based on model
-    provider = None
-    
-    if request.model == AIModel.GPT_4O:
-        if not openai_provider:
-            raise HTTPException(
-                status_code=503,
-                detail="OpenAI service not available (API key not configured)"
-            )
-        provider = openai_provider
-    
-    elif request.model == AIModel.CLAUDE_3_5_SONNET:
-        if not claude_provider:
-            raise HTTPException(
-                status_code=503,
-                detail="Claude service not available (API key not configured)"
-            )
-        provider = claude_provider
-    
-    elif request.model == AIModel.GPT_OSS:
-        if not ollama_provider:
-            raise HTTPException(
-                status_code=503,
-                detail="Ollama service not available (service not running)"
-            )
-        # Check if Ollama service is actually running
-        if not await ollama_provider.check_health():
-            raise HTTPException(
-                status_code=503,
-                detail="Ollama service not available (cannot connect to localhost:11434)"
-            )
-        provider = ollama_provider
-    
-    else:
+    entry = providers.get(request.model)
+    if entry is None:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported model: {request.model}"
         )
+    if entry.provider is None:
+        raise HTTPException(status_code=503, detail=entry.unavailable_detail)
+    # Check if the service is actually running (local providers only)
+    if entry.health_check is not None and not await entry.health_check():
+        raise HTTPException(status_code=503, detail=entry.unreachable_detail)
+    provider = entry.provider
 
     # Stream response
     async def generate_stream():
         try:
             # Check if this is a direct tool call
-            if request.tool_call:
+            tool_call = request.tool_call
+            if tool_call:
                 # Execute tool directly instead of going through AI
-                timestamp = int(asyncio.get_event_loop().time() * 1000)
-                
+                tool_name, parameters, context = tool_call.tool_name, tool_call.parameters, request.context
+
                 # Send tool execution status
-                yield f"data: {json.dumps(ToolStatusChunk(tool=request.tool_call.tool_name, status='executing', timestamp=timestamp).dict())}\n\n"
+                yield tool_status_frame(tool_name, ToolStatus.EXECUTING, now_ms())
                 
                 try:
                     # Execute the tool
-                    tool_result = await get_tool_executor().execute_tool(
-                        request.tool_call.tool_name,
-                        request.tool_call.parameters,
-                        context=request.context
-                    )
+                    tool_result = await tool_executor.execute_tool(tool_name, parameters, context=context)
                     
                     # Send tool result
-                    result_timestamp = int(asyncio.get_event_loop().time() * 1000)
-                    yield f"data: {json.dumps(ToolResultChunk(tool=request.tool_call.tool_name, result=tool_result['result'], timestamp=result_timestamp).dict())}\n\n"
-                    yield f"data: {json.dumps(ToolStatusChunk(tool=request.tool_call.tool_name, status='completed', timestamp=result_timestamp).dict())}\n\n"
+                    result_timestamp = now_ms()
+                    yield frame(TOOL_RESULT_DUMP({"type": StreamChunkType.TOOL_RESULT, "tool": tool_name, "result": tool_result['result'], "timestamp": result_timestamp}))
+                    yield tool_status_frame(tool_name, ToolStatus.COMPLETED, result_timestamp)
                     
                 except Exception as tool_error:
-                    error_timestamp = int(asyncio.get_event_loop().time() * 1000)
-                    yield f"data: {json.dumps(ErrorChunk(error=f'Tool execution failed: {str(tool_error)}', timestamp=error_timestamp).dict())}\n\n"
+                    yield frame(ERROR_DUMP({"type": StreamChunkType.ERROR, "error": f"Tool execution failed: {str(tool_error)}", "timestamp": now_ms()}))
                 
                 # Send completion
-                done_timestamp = int(asyncio.get_event_loop().time() * 1000)
-                yield f"data: {json.dumps(DoneChunk(timestamp=done_timestamp).dict())}\n\n"
+                yield DONE_FRAME
                 
             else:
-                # Normal AI chat stream
+                cache_key = chat_cache.key(request.model, request.message, request.context) if chat_cache else None
+                cached = chat_cache.get(cache_key) if chat_cache else None
+                if cached is not None:
+                    yield frame(AI_CHUNK_DUMP({"type": StreamChunkType.AI_CHUNK, "content": cached, "timestamp": now_ms()}))
+                    yield DONE_FRAME
+                    return
+
+                # Normal AI chat stream; only plain text replies are cached,
+                # since tool calls can have side effects
+                content_parts = []
+                cacheable = chat_cache is not None
+                completed = False
                 async for chunk in provider.stream_chat(
                     request.message,
                     request.context
                 ):
-                    yield f"data: {json.dumps(chunk)}\n\n"
+                    chunk_type = chunk["type"]
+                    if chunk_type == StreamChunkType.AI_CHUNK:
+                        content_parts.append(chunk["content"])
+                    elif chunk_type == StreamChunkType.DONE:
+                        completed = True
+                    else:
+                        cacheable = False
+
+                    yield frame(orjson.dumps(chunk, option=orjson.OPT_NON_STR_KEYS))
+
+                if cacheable and completed and content_parts:
+                    chat_cache.put(cache_key, "".join(content_parts))
         except Exception as e:
-            error_chunk = {
-                "type": "error",
-                "error": str(e),
-                "timestamp": int(asyncio.get_event_loop().time() * 1000)
-            }
-            yield f"data: {json.dumps(error_chunk)}\n\n"
-
-    return StreamingResponse(
-        generate_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control",
-        }
-    )
+            error_timestamp = now_ms()
+            yield frame(ERROR_DUMP({"type": StreamChunkType.ERROR, "error": str(e), "timestamp": error_timestamp}))
+
+    return EventStreamResponse(generate_stream())
+
 
+async def _unavailable() -> bool:
+    """Availability probe for a provider that is not configured."""
+    return False
 
 
 @router.get("/health")
-async def health_check():
+@cache(expire=5)  # Short so provider availability flaps propagate quickly
+async def health_check(
+    openai_provider: Optional[OpenAIProvider] = Depends(get_openai_provider),
+    claude_provider: Optional[ClaudeProvider] = Depends(get_claude_provider),
+):
     """Health check endpoint."""
-    # Check model availability
-    model_status = {}
-    
-    if openai_provider:
-        model_status["openai"] = await openai_provider.is_available()
-    else:
-        model_status["openai"] = False
-    
-    if claude_provider:
-        model_status["claude"] = await claude_provider.is_available()
-    else:
-        model_status["claude"] = False
+    # Probe model availability concurrently; a failed probe counts as unavailable
+    openai_ok, claude_ok = await asyncio.gather(
+        openai_provider.is_available() if openai_provider else _unavailable(),
+        claude_provider.is_available() if claude_provider else _unavailable(),
+        return_exceptions=True,
+    )
+    model_status = {"openai": openai_ok is True, "claude": claude_ok is True}
 
     # Determine overall status
     available_count = sum(model_status.values())
@@ -151,7 +184,7 @@ async def health_check():
     return {
         "status": status,
         "version": "1.0.0",
-        "uptime": int(asyncio.get_event_loop().time()),
+        "uptime": int(time.monotonic()),
         "models": model_status,
-        "timestamp": int(asyncio.get_event_loop().time() * 1000)
+        "timestamp": now_ms()
     }
\ No newline at end of file
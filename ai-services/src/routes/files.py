@@ -1,43 +1,73 @@
 
-from fastapi import APIRouter, HTTPException
-from src.services.tool_executor import get_tool_executor
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from src.services.tool_executor import ToolExecutor, ToolExecutionError, get_tool_executor
 
-import traceback
-from typing import Dict
+import logging
+from typing import Any, AsyncIterator, Dict
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.get("/files/tree")
-async def get_file_tree(path: str = '.'):
+# Same envelope execute_tool returns, split around the streamed tree array
+_TREE_PREFIX = b'{"success":true,"tool_name":"list_directory","result":{"tree":['
+_TREE_SUFFIX = b'}}'
+
+
+async def _tree_stream(items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """Encode the tree array one entry at a time.
+
+    A walk that fails mid-stream still closes the envelope, reporting the
+    error next to the partial tree.
+    """
+    yield _TREE_PREFIX
+    first = True
     try:
-        tool_executor = get_tool_executor()
-        result = await tool_executor.execute_tool("list_directory", {"path": path})
-        return result
+        async for item in items:
+            yield orjson.dumps(item) if first else b',' + orjson.dumps(item)
+            first = False
     except Exception as e:
-        traceback.print_exc() # Print the full traceback
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Failed while streaming directory tree")
+        yield b'],"error":' + orjson.dumps(f"Error listing directory: {e}") + _TREE_SUFFIX
+        return
+    yield b']' + _TREE_SUFFIX
+
+
+@router.get("/files/tree")
+async def get_file_tree(path: str = '.', tool_executor: ToolExecutor = Depends(get_tool_executor)):
+    try:
+        entries = await tool_executor.execute_tool_stream("list_directory", {"path": path})
+    except ToolExecutionError:
+        # Invalid directory: fall back to the buffered tool for its error result
+        try:
+            return await tool_executor.execute_tool("list_directory", {"path": path})
+        except Exception as e:
+            logger.exception("Failed to list directory %s", path)
+            raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(_tree_stream(entries), media_type="application/json")
 
 @router.get("/files/content")
-async def get_file_content(path: str, workingDirectory: str = None):
+async def get_file_content(path: str, workingDirectory: str = None, tool_executor: ToolExecutor = Depends(get_tool_executor)):
     try:
-        tool_executor = get_tool_executor()
         result = await tool_executor.execute_tool("read_file", {"absolute_path": path, "base_path": workingDirectory})
         return result
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Failed to read file %s", path)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/files/write")
-async def write_file_route(request: Dict[str, str]):
+async def write_file_route(request: Dict[str, str], tool_executor: ToolExecutor = Depends(get_tool_executor)):
     file_path = request.get("file_path")
     content = request.get("content")
     working_directory = request.get("workingDirectory")
     if not file_path or content is None:
         raise HTTPException(status_code=400, detail="file_path and content are required")
     try:
-        tool_executor = get_tool_executor()
         result = await tool_executor.execute_tool("write_file", {"file_path": file_path, "content": content, "base_path": working_directory})
         return result
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Failed to write file %s", file_path)
         raise HTTPException(status_code=500, detail=str(e))
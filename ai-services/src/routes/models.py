@@ -1,21 +1,17 @@
 """Models route for AI services."""
-from fastapi import APIRouter
-from typing import List, Dict, Any
-from src.config import settings
-from src.services.providers.openai_provider import openai_provider
-from src.services.providers.claude_provider import claude_provider
-from src.services.providers.ollama_provider import ollama_provider
+from fastapi import APIRouter, Depends
+from fastapi_cache.decorator import cache
+from typing import List, Dict, Any, Optional
+from src.config import Settings, get_settings
+from src.services.providers.openai_provider import OpenAIProvider, get_openai_provider
+from src.services.providers.claude_provider import ClaudeProvider, get_claude_provider
+from src.services.providers.ollama_provider import OllamaProvider, get_ollama_provider
 
 router = APIRouter()
 
-
-@router.get("/models")
-async def get_models():
-    """Get available AI models and their status."""
-    models = []
-    
-    # GPT-4o model
-    models.append({
+# Static model descriptors; only availability is computed per request
+_MODELS = (
+    {
         "id": "gpt-4o",
         "name": "GPT-4o",
         "provider": "openai",
@@ -26,11 +22,8 @@ async def get_models():
             "tool-calling",
             "image-analysis"
         ],
-        "available": openai_provider is not None and bool(settings.openai_api_key)
-    })
-    
-    # Claude 3.5 Sonnet model
-    models.append({
+    },
+    {
         "id": "claude-3.5-sonnet",
         "name": "Claude 3.5 Sonnet",
         "provider": "anthropic",
@@ -41,18 +34,8 @@ async def get_models():
             "tool-calling",
             "reasoning"
         ],
-        "available": claude_provider is not None and bool(settings.anthropic_api_key)
-    })
-    
-    # GPT-OSS model (Ollama)
-    ollama_available = False
-    if ollama_provider:
-        try:
-            ollama_available = await ollama_provider.check_health()
-        except Exception:
-            ollama_available = False
-    
-    models.append({
+    },
+    {
         "id": "gpt-oss",
         "name": "GPT-OSS (Local)",
         "provider": "ollama",
@@ -63,22 +46,48 @@ async def get_models():
             "tool-calling",
             "local-execution"
         ],
-        "available": ollama_available
-    })
-    
-    # Calculate statistics
-    total_models = len(models)
-    available_models = sum(1 for model in models if model["available"])
+    },
+)
+
+
+@router.get("/models")
+@cache(expire=60)
+async def get_models(
+    settings: Settings = Depends(get_settings),
+    openai_provider: Optional[OpenAIProvider] = Depends(get_openai_provider),
+    claude_provider: Optional[ClaudeProvider] = Depends(get_claude_provider),
+    ollama_provider: OllamaProvider = Depends(get_ollama_provider),
+):
+    """Get available AI models and their status."""
+    ollama_available = False
+    if ollama_provider:
+        try:
+            ollama_available = await ollama_provider.check_health()
+        except Exception:
+            ollama_available = False
+
+    availability = {
+        "gpt-4o": openai_provider is not None and bool(settings.openai_api_key),
+        "claude-3.5-sonnet": claude_provider is not None and bool(settings.anthropic_api_key),
+        "gpt-oss": ollama_available,
+    }
+    models = [{**model, "available": availability[model["id"]]} for model in _MODELS]
     
     return {
         "models": models,
-        "total": total_models,
-        "available": available_models
+        "total": len(models),
+        "available": sum(availability.values())
     }
 
 
 @router.get("/health")
-async def get_health():
+@cache(expire=5)  # Short so provider availability flaps propagate quickly
+async def get_health(
+    settings: Settings = Depends(get_settings),
+    openai_provider: Optional[OpenAIProvider] = Depends(get_openai_provider),
+    claude_provider: Optional[ClaudeProvider] = Depends(get_claude_provider),
+    ollama_provider: OllamaProvider = Depends(get_ollama_provider),
+):
     """Get health status of AI services."""
     # Check provider availability
     openai_available = openai_provider is not None and bool(settings.openai_api_key)
@@ -0,0 +1,95 @@
+"""Server-sent events response for the chat streaming route."""
+import asyncio
+from typing import AsyncIterator
+
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Built once; CORS headers are added by CORSMiddleware
+SSE_HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+]
+
+# SSE comment line; ignored by EventSource and our frontend parser, but keeps
+# proxies from timing out the connection during long tool calls
+PING_FRAME = b": ping\n\n"
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    """Consume ASGI messages until the client goes away."""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+class EventStreamResponse(Response):
+    """Stream pre-framed ``data: ...\\n\\n`` bytes straight to the ASGI ``send``.
+
+    Unlike ``StreamingResponse`` there is no task group or per-chunk encoding:
+    each frame is one ``http.response.body`` message. Frames are produced in
+    their own task, which is cancelled as soon as the client disconnects, so a
+    stalled upstream LLM call is abandoned rather than awaited.
+    A keep-alive ping is sent whenever no frame went out for ``ping_interval``
+    seconds.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, frames: AsyncIterator[bytes], status_code: int = 200, ping_interval: float = 15.0) -> None:
+        self.frames = frames
+        self.status_code = status_code
+        self.ping_interval = ping_interval
+        self.background = None
+        self.raw_headers = list(SSE_HEADERS)
+        self._sent_since_ping = False
+        # The pinger and the frame producer share one ASGI send
+        self._send_lock = asyncio.Lock()
+
+    async def _send_body(self, send: Send, body: bytes) -> None:
+        async with self._send_lock:
+            await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    async def _ping(self, send: Send) -> None:
+        """Send a keep-alive comment after every idle ``ping_interval``."""
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            if not self._sent_since_ping:
+                await self._send_body(send, PING_FRAME)
+            self._sent_since_ping = False
+
+    async def _stream(self, send: Send) -> None:
+        """Send every frame as it is produced."""
+        async for frame in self.frames:
+            self._sent_since_ping = True
+            await self._send_body(send, frame)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        watcher = asyncio.ensure_future(_wait_for_disconnect(receive))
+        tasks = [watcher]
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            pinger = asyncio.ensure_future(self._ping(send))
+            streamer = asyncio.ensure_future(self._stream(send))
+            tasks += (pinger, streamer)
+            await asyncio.wait((streamer, watcher), return_when=asyncio.FIRST_COMPLETED)
+            if not streamer.done():
+                # Client went away; cancelling interrupts the pending upstream read
+                return
+            streamer.result()
+            async with self._send_lock:
+                # Cancelled under the lock so a ping is never cut off mid-send
+                pinger.cancel()
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        except OSError:
+            # ASGI 2.4 servers raise on send once the client has gone
+            return
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let the cancelled producer unwind before closing its generator;
+            # this also retrieves a pinger send error after a disconnect
+            await asyncio.gather(*tasks, return_exceptions=True)
+            aclose = getattr(self.frames, "aclose", None)
+            if aclose is not None:
+                await aclose()
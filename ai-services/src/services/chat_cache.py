@@ -0,0 +1,66 @@
+"""Reply cache for repeated chat turns."""
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import orjson
+
+from src.config import get_settings
+from src.models.chat import AIModel, ChatContext
+
+# Bound on cached replies per worker
+MAX_ENTRIES = 512
+
+
+class ChatResponseCache:
+    """In-process LRU of text-only replies keyed by model, message and context.
+
+    The message is whitespace-normalized and the full context (including
+    referenced file contents) is hashed, so a reply is only reused for the
+    same question about the same code.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def key(model: AIModel, message: str, context: Optional[ChatContext] = None) -> str:
+        """Build the cache key for a chat turn."""
+        digest = hashlib.sha256()
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(" ".join(message.split()).encode())
+        digest.update(b"\0")
+        if context is not None:
+            digest.update(orjson.dumps(context.model_dump(), option=orjson.OPT_SORT_KEYS))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached reply, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, content = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store a reply, evicting the least recently used one when full."""
+        self._entries[key] = (time.monotonic(), content)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_chat_cache() -> Optional[ChatResponseCache]:
+    """Get the shared reply cache, or None if CHAT_CACHE_TTL is 0."""
+    ttl = get_settings().chat_cache_ttl
+    return ChatResponseCache(ttl) if ttl > 0 else None
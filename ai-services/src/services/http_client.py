@@ -0,0 +1,32 @@
+"""Shared HTTP clients for upstream LLM API calls."""
+from functools import lru_cache
+
+import httpx
+
+from src.config import get_settings
+
+
+def _client_options() -> dict:
+    """HTTP/2 with a keep-alive pool sized for LLM traffic."""
+    return {
+        "http2": True,
+        "limits": httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=30,
+        ),
+        "timeout": httpx.Timeout(get_settings().request_timeout, connect=5.0),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the LLM SDK clients."""
+    return httpx.AsyncClient(**_client_options())
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async HTTP client if it was created."""
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
+        get_async_http_client.cache_clear()
@@ -1,27 +1,57 @@
 """Claude provider for AI chat functionality."""
-import asyncio
-import json
+import io
 import time
+from functools import lru_cache
 from typing import AsyncGenerator, Dict, Any, Optional
 
+import httpx
 import anthropic
-from anthropic import Anthropic
-
-from src.config import settings
-from src.models.streaming import AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk
+from anthropic import AsyncAnthropic
+
+from src.config import get_settings
+from src.services.http_client import get_async_http_client
+from src.models.streaming import (
+    StreamChunkType,
+    ToolStatus,
+    AIChunkPayload,
+    ToolStatusPayload,
+    ToolResultPayload,
+    DonePayload,
+    ErrorPayload,
+    now_ms,
+)
 from src.models.chat import ChatContext
 from src.services.tool_executor import get_tool_executor, ToolExecutionError
 
+# Request-invariant prompt text, built once at import
+SYSTEM_PROMPT = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
+
+Available tools:
+- generate_code_diff: Compare two versions of code and show differences
+- generate_documentation: Create BRD, SRD, README, or API documentation
+- analyze_code_structure: Analyze code patterns, structure, and provide improvement suggestions
+- refactor_code: Refactor code with specific strategies (optimize, modernize, add types, extract components)
+
+Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results. Be proactive in suggesting improvements and best practices."""
+
+# Seconds an availability probe result is reused by the health endpoints
+AVAILABILITY_TTL = 30.0
+
+DOCUMENTATION_PROMPT_TEMPLATE = "\n\nThe user has indicated they want to generate the following documentation types: {selected_docs}. Prioritize using the 'generate_documentation' tool for these types when relevant to the user's query."
+
 
 class ClaudeProvider:
     """Claude provider for Claude 3.5 Sonnet model."""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        settings = get_settings()
         if not settings.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
         
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key, http_client=http_client)
         self.model = "claude-3-5-sonnet-20241022"
+        self._available: Optional[bool] = None
+        self._available_checked_at = 0.0
 
     async def stream_chat(
         self, 
@@ -34,99 +64,106 @@ class ClaudeProvider:
             # Prepare messages and system prompt
             messages, system_prompt = self._prepare_messages(message, context, documentation_settings)
             
+            # Resolve the shared executor once per request
+            tool_executor = get_tool_executor()
+
             # Get available tools
-            tools = list(get_tool_executor().get_available_tools().values())
-
-            # Create streaming completion
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.messages.create(
-                    model=self.model,
-                    messages=messages,
-                    system=system_prompt,
-                    tools=tools,
-                    tool_choice={"type": "auto"},
-                    stream=True,
-                    temperature=settings.temperature,
-                    max_tokens=settings.max_tokens
-                )
-            )
+            tools = tool_executor.tools_list_cached()
 
             current_tool_call = None
-            
-            for chunk in response:
-                if chunk.type == "content_block_start":
-                    if chunk.content_block.type == "tool_use":
-                        # Tool execution starting
-                        current_tool_call = {
-                            "id": chunk.content_block.id,
-                            "name": chunk.content_block.name,
-                            "input": {}
-                        }
+
+            # Stream natively on the event loop; the stream helper also
+            # attaches the finished content block to content_block_stop
+            async with self.client.messages.stream(
+                model=self.model,
+                messages=messages,
+                system=system_prompt,
+                tools=tools,
+                tool_choice={"type": "auto"},
+                temperature=get_settings().temperature,
+                max_tokens=get_settings().max_tokens
+            ) as response:
+                async for chunk in response:
+                    if chunk.type == "content_block_start":
+                        if chunk.content_block.type == "tool_use":
+                            # Tool execution starting
+                            current_tool_call = {
+                                "id": chunk.content_block.id,
+                                "name": chunk.content_block.name,
+                                "input": {}
+                            }
                         
-                        yield ToolStatusChunk(
-                            tool=chunk.content_block.name,
-                            status="executing",
-                            timestamp=int(time.time() * 1000)
-                        ).dict()
-
-                elif chunk.type == "content_block_delta":
-                    if chunk.delta.type == "text_delta":
-                        # Regular text content
-                        yield AIChunk(
-                            content=chunk.delta.text,
-                            timestamp=int(time.time() * 1000)
-                        ).dict()
-
-                elif chunk.type == "content_block_stop":
-                    if hasattr(chunk, 'content_block') and chunk.content_block.type == "tool_use":
-                        # Tool execution completed
-                        try:
-                            tool_name = chunk.content_block.name
-                            tool_input = chunk.content_block.input
-                            
-                            # Execute tool
-                            tool_result = await get_tool_executor().execute_tool(
-                                tool_name, 
-                                tool_input
+                            yield ToolStatusPayload(
+                                type=StreamChunkType.TOOL_STATUS,
+                                tool=chunk.content_block.name,
+                                status=ToolStatus.EXECUTING,
+                                timestamp=now_ms()
                             )
 
-                            if tool_result["success"]:
-                                yield ToolResultChunk(
-                                    tool=tool_name,
-                                    result=tool_result["result"],
-                                    timestamp=int(time.time() * 1000)
-                                ).dict()
-
-                                yield ToolStatusChunk(
-                                    tool=tool_name,
-                                    status="completed",
-                                    timestamp=int(time.time() * 1000)
-                                ).dict()
-                            else:
-                                yield ToolStatusChunk(
-                                    tool=tool_name,
-                                    status="failed",
-                                    timestamp=int(time.time() * 1000)
-                                ).dict()
-
-                        except ToolExecutionError as e:
-                            yield ErrorChunk(
-                                error=f"Tool execution failed: {str(e)}",
-                                timestamp=int(time.time() * 1000)
-                            ).dict()
-
-                elif chunk.type == "message_stop":
-                    break
+                    elif chunk.type == "content_block_delta":
+                        if chunk.delta.type == "text_delta":
+                            # Regular text content
+                            yield AIChunkPayload(
+                                type=StreamChunkType.AI_CHUNK,
+                                content=chunk.delta.text,
+                                timestamp=now_ms()
+                            )
+
+                    elif chunk.type == "content_block_stop":
+                        if hasattr(chunk, 'content_block') and chunk.content_block.type == "tool_use":
+                            # Tool execution completed
+                            try:
+                                tool_name = chunk.content_block.name
+                                tool_input = chunk.content_block.input
+                            
+                                # Execute tool
+                                tool_result = await tool_executor.execute_tool(
+                                    tool_name, 
+                                    tool_input
+                                )
+
+                                ts = now_ms()
+                                if tool_result["success"]:
+                                    yield ToolResultPayload(
+                                        type=StreamChunkType.TOOL_RESULT,
+                                        tool=tool_name,
+                                        result=tool_result["result"],
+                                        timestamp=ts
+                                    )
+
+                                    yield ToolStatusPayload(
+                                        type=StreamChunkType.TOOL_STATUS,
+                                        tool=tool_name,
+                                        status=ToolStatus.COMPLETED,
+                                        timestamp=ts
+                                    )
+                                else:
+                                    yield ToolStatusPayload(
+                                        type=StreamChunkType.TOOL_STATUS,
+                                        tool=tool_name,
+                                        status=ToolStatus.FAILED,
+                                        timestamp=ts
+                                    )
+
+                            except ToolExecutionError as e:
+                                yield ErrorPayload(
+                                    type=StreamChunkType.ERROR,
+                                    error=f"Tool execution failed: {str(e)}",
+                                    timestamp=now_ms()
+                                )
+
+                    elif chunk.type == "message_stop":
+                        break
 
             # Send completion signal
-            yield DoneChunk(timestamp=int(time.time() * 1000)).dict()
+            yield DonePayload(type=StreamChunkType.DONE, timestamp=now_ms())
 
         except Exception as e:
-            yield ErrorChunk(
+            yield ErrorPayload(
+                type=StreamChunkType.ERROR,
                 error=f"Claude API error: {str(e)}",
-                timestamp=int(time.time() * 1000)
-            ).dict()
+                timestamp=now_ms()
+            )
 
     def _prepare_messages(
         self, 
@@ -135,40 +172,36 @@ class ClaudeProvider:
         documentation_settings: Optional[Dict[str, bool]] = None
     ) -> tuple:
         """Prepare messages and system prompt for Claude API."""
-        system_prompt = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
-
-Available tools:
-- generate_code_diff: Compare two versions of code and show differences
-- generate_documentation: Create BRD, SRD, README, or API documentation
-- analyze_code_structure: Analyze code patterns, structure, and provide improvement suggestions
-- refactor_code: Refactor code with specific strategies (optimize, modernize, add types, extract components)
-
-Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results. Be proactive in suggesting improvements and best practices."""
-
+        system_prompt = SYSTEM_PROMPT
         if documentation_settings:
-            selected_docs = [doc_type for doc_type, selected in documentation_settings.items() if selected]
+            selected_docs = ", ".join(doc_type for doc_type, selected in documentation_settings.items() if selected)
             if selected_docs:
-                system_prompt += f"\n\nThe user has indicated they want to generate the following documentation types: {', '.join(selected_docs)}. Prioritize using the 'generate_documentation' tool for these types when relevant to the user's query."
+                system_prompt += DOCUMENTATION_PROMPT_TEMPLATE.format_map({"selected_docs": selected_docs})
 
         messages = []
 
-        # Add context if provided
+        # Add context if provided; segments are written straight into one
+        # buffer so large file contents are not copied into f-strings first
         if context:
-            context_parts = []
+            buf = io.StringIO()
             
             if context.file_path:
-                context_parts.append(f"File: {context.file_path}")
+                buf.write("\nFile: ")
+                buf.write(context.file_path)
             
             if context.code_content:
-                context_parts.append(f"Code:\n```\n{context.code_content}\n```")
+                buf.write("\nCode:\n```\n")
+                buf.write(context.code_content)
+                buf.write("\n```")
             
             if context.project_structure:
-                context_parts.append(f"Project structure:\n{context.project_structure}")
+                buf.write("\nProject structure:\n")
+                buf.write(context.project_structure)
 
-            if context_parts:
+            if buf.tell():
                 messages.append({
                     "role": "user",
-                    "content": f"Current context:\n{chr(10).join(context_parts)}"
+                    "content": "Current context:" + buf.getvalue()
                 })
 
         # Add user message
@@ -180,20 +213,23 @@ Use tools when appropriate to help users with their coding tasks. Always provide
         return messages, system_prompt
 
     async def is_available(self) -> bool:
-        """Check if Claude API is available."""
+        """Check if Claude API is available (memoized for AVAILABILITY_TTL seconds)."""
+        now = time.monotonic()
+        if self._available is not None and now - self._available_checked_at < AVAILABILITY_TTL:
+            return self._available
+
+        # A metadata GET validates the key without a billable completion
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.messages.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": "test"}],
-                    max_tokens=1
-                )
-            )
-            return True
+            await self.client.models.list(limit=1)
+            available = True
         except Exception:
-            return False
+            available = False
+
+        self._available, self._available_checked_at = available, now
+        return available
 
 
-# Global provider instance
-claude_provider = ClaudeProvider() if settings.anthropic_api_key else None
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_claude_provider() -> Optional[ClaudeProvider]:
+    """Get the shared Claude provider, or None if no API key is configured."""
+    return ClaudeProvider(http_client=get_async_http_client()) if get_settings().anthropic_api_key else None
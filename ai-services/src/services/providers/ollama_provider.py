@@ -1,23 +1,146 @@
 """Ollama provider for local AI models with full GPT-4o feature parity."""
 import asyncio
-import json
+import io
+import logging
 import time
+from functools import lru_cache
 import aiohttp
-from typing import AsyncGenerator, Dict, Any, Optional, List
+import orjson
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, Optional, List
 
-from src.config import settings
-from src.models.streaming import AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk
+from src.config import get_settings
+from src.models.streaming import (
+    StreamChunkType,
+    ToolStatus,
+    AIChunkPayload,
+    ToolStatusPayload,
+    ToolResultPayload,
+    DonePayload,
+    ErrorPayload,
+    now_ms,
+)
 from src.models.chat import ChatContext
-from src.services.tool_executor import get_tool_executor, ToolExecutionError
+from src.services.tool_executor import ToolExecutor, get_tool_executor, ToolExecutionError
+
+logger = logging.getLogger(__name__)
+
+# Seconds a health probe result is reused, so /chat, /models and /health
+# polled together hit Ollama once; failures are retried sooner
+HEALTH_TTL = 5.0
+UNHEALTHY_TTL = 1.0
+
+# Small token deltas are buffered and sent as one chunk per interval or once
+# this many characters are pending
+COALESCE_INTERVAL = 0.010
+COALESCE_MAX_CHARS = 256
+
+# Socket read buffer for streamed responses, and a sanity cap on one NDJSON
+# frame (a tool call with embedded code can be several MB)
+READ_BUFSIZE = 4 * 1024 * 1024
+MAX_LINE = 8 * 1024 * 1024
+
+# Request bodies are pre-encoded with orjson rather than aiohttp's json= path
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request-invariant prompt text, built once at import
+SYSTEM_PROMPT = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
+
+Available tools:
+- generate_code: For generating code in any language. Use this when the user asks you to generate code.
+- generate_documentation: For creating a single document (BRD, SRD, README, or API_DOCS).
+- generate_multiple_documentation: For creating multiple documents at once.
+- modify_file_with_diff: PREFERRED for any code improvements, optimizations, or changes. Shows red/green diff for user approval before applying changes.
+- smart_code_action: AI-powered code improvements with automatic strategy selection and diff preview.  
+- comprehensive_code_review: Complete code review with security analysis, quality metrics, and AI insights.
+- security_analysis: Analyze code for security vulnerabilities and weaknesses.
+- analyze_code_structure: Analyze code patterns and structure
+- refactor_code: Basic refactoring (use modify_file_with_diff instead for actual code changes)
+
+IMPORTANT:
+- When asked to generate code, use the `generate_code` tool. For example, if the user asks "Generate me a python function to find the first 20 fibonacci numbers", you should call the `generate_code` tool with the prompt "a python function to find the first 20 fibonacci numbers" and the file_path "fibonacci.py".
+- When asked to generate documentation, use the `generate_documentation` or `generate_multiple_documentation` tools. Infer the `doc_types` from the user's message.
+- When users request code improvements, optimizations, fixes, or changes to files, ALWAYS use 'modify_file_with_diff' to show a visual diff for approval.
+
+Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results."""
+
+
+class _DeltaCoalescer:
+    """Buffer text deltas so fast local models don't produce one chunk per token."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._parts: List[str] = []
+        self._chars = 0
+        # The first delta is sent right away to keep time-to-first-token low
+        self._last_flush = float("-inf")
+
+    def add(self, content: str) -> Optional[str]:
+        """Buffer a delta; return the coalesced text when it is due to be sent."""
+        self._parts.append(content)
+        self._chars += len(content)
+        if self._chars >= COALESCE_MAX_CHARS or self._loop.time() - self._last_flush >= COALESCE_INTERVAL:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return and clear the buffered text, if any."""
+        if not self._parts:
+            return None
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._chars = 0
+        self._last_flush = self._loop.time()
+        return text
+
+    def flush_delay(self) -> Optional[float]:
+        """Seconds until the buffered text is due, or None if nothing is buffered."""
+        if not self._parts:
+            return None
+        return max(0.0, self._last_flush + COALESCE_INTERVAL - self._loop.time())
+
+    async def paced(self, lines: AsyncIterator[bytes]) -> AsyncGenerator[Optional[bytes], None]:
+        """Relay lines, yielding None whenever buffered text falls due first.
+
+        Lets a stalled upstream still get its pending text flushed on time;
+        the consumer is expected to flush() on None.
+        """
+        iterator = lines.__aiter__()
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                # With nothing buffered the timeout is None, so this waits for the line
+                done, _ = await asyncio.wait((pending,), timeout=self.flush_delay())
+                if not done:
+                    yield None
+                    continue
+                next_line, pending = pending, None
+                try:
+                    line = next_line.result()
+                except StopAsyncIteration:
+                    return
+                yield line
+        finally:
+            if pending is not None:
+                pending.cancel()
 
 
 class OllamaProvider:
     """Ollama provider for local models with full tool calling support."""
 
     def __init__(self):
+        settings = get_settings()
         self.base_url = getattr(settings, 'ollama_base_url', 'http://localhost:11434')
         self.model = getattr(settings, 'ollama_model', 'gpt-oss:latest')
         self.timeout = getattr(settings, 'ollama_timeout', 120)
+        self._semaphore = asyncio.Semaphore(getattr(settings, 'ollama_max_concurrency', 1))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._health: Optional[bool] = None
+        self._health_checked_at = 0.0
+        self._health_probe: Optional[asyncio.Future] = None
+        self._ollama_tools: List[Dict] = []
+        self._ollama_tools_source: Optional[List[Dict]] = None
         
     async def stream_chat(
         self, 
@@ -29,23 +152,33 @@ class OllamaProvider:
             # Prepare messages with context
             messages = self._prepare_messages(message, context)
             
+            # Resolve the shared executor once per request
+            tool_executor = get_tool_executor()
+
             # Get available tools
-            tools = get_tool_executor().get_available_tools()
+            tools = tool_executor.tools_list_cached()
             
             # Check if model supports tool calling by making initial request
-            async with aiohttp.ClientSession() as session:
-                # First, try with tool calling capability
-                request_payload = {
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": True,
-                    "tools": self._convert_tools_to_ollama_format(tools) if tools else None
-                }
+            session = self._get_session()
+            # First, try with tool calling capability
+            request_payload = {
+                "model": self.model,
+                "messages": messages,
+                "stream": True,
+                "tools": self._get_ollama_tools(tools) if tools else None
+            }
+
+            # Tool calls are collected while the stream is read and run once
+            # the slot is released, since they are slow and may call the LLM again
+            tool_calls: List[Dict] = []
+            completed = False
                 
+            # Ollama largely serializes generation, so cap in-flight requests
+            async with self._semaphore:
                 async with session.post(
                     f"{self.base_url}/api/chat",
-                    json=request_payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    data=orjson.dumps(request_payload),
+                    headers=JSON_HEADERS
                 ) as response:
                     if response.status != 200:
                         # Fallback to simple generation if chat API fails
@@ -54,46 +187,83 @@ class OllamaProvider:
                         return
                     
                     # Process streaming response
-                    async for line in response.content:
-                        if line.strip():
-                            try:
-                                data = json.loads(line.decode('utf-8'))
-                                
-                                # Handle regular message content
-                                if 'message' in data and 'content' in data['message']:
-                                    content = data['message']['content']
-                                    if content:
-                                        yield AIChunk(
-                                            content=content,
-                                            timestamp=int(time.time() * 1000)
-                                        ).dict()
-                                
-                                # Handle tool calls if present
-                                if 'message' in data and 'tool_calls' in data['message']:
-                                    tool_calls = data['message']['tool_calls']
-                                    for tool_call in tool_calls:
-                                        async for chunk in self._handle_tool_call(tool_call, context):
-                                            yield chunk
-                                
-                                # Handle completion
-                                if data.get('done', False):
-                                    yield DoneChunk(
-                                        timestamp=int(time.time() * 1000)
-                                    ).dict()
-                                    break
-                                    
-                            except json.JSONDecodeError:
-                                continue
-                            except Exception as e:
-                                print(f"Error processing Ollama response: {e}")
-                                continue
+                    coalescer = _DeltaCoalescer()
+                    async for line in coalescer.paced(self._iter_ndjson(response)):
+                        if line is None:
+                            # Upstream is idle; send the text whose window has passed
+                            if text := coalescer.flush():
+                                yield AIChunkPayload(
+                                    type=StreamChunkType.AI_CHUNK,
+                                    content=text,
+                                    timestamp=now_ms()
+                                )
+                            continue
+                        try:
+                            data = orjson.loads(line)
+                            
+                            # Handle regular message content
+                            if 'message' in data and 'content' in data['message']:
+                                content = data['message']['content']
+                                if content and (text := coalescer.add(content)):
+                                    yield AIChunkPayload(
+                                        type=StreamChunkType.AI_CHUNK,
+                                        content=text,
+                                        timestamp=now_ms()
+                                    )
+                            
+                            # Send buffered text before tool results and completion
+                            if 'tool_calls' in data.get('message', ()) or data.get('done', False):
+                                if text := coalescer.flush():
+                                    yield AIChunkPayload(
+                                        type=StreamChunkType.AI_CHUNK,
+                                        content=text,
+                                        timestamp=now_ms()
+                                    )
+                            
+                            # Collect tool calls if present
+                            if 'message' in data and 'tool_calls' in data['message']:
+                                tool_calls.extend(data['message']['tool_calls'])
+                            
+                            # Handle completion
+                            if data.get('done', False):
+                                completed = True
+                                break
                                 
+                        except orjson.JSONDecodeError:
+                            continue
+                        except Exception as e:
+                            logger.warning("Error processing Ollama response", exc_info=True)
+                            continue
+
+                    # Stream ended without a done frame
+                    if text := coalescer.flush():
+                        yield AIChunkPayload(
+                            type=StreamChunkType.AI_CHUNK,
+                            content=text,
+                            timestamp=now_ms()
+                        )
+
+            # Run the turn's tool calls concurrently; gather keeps their order
+            if tool_calls:
+                for chunk in await asyncio.gather(*(
+                    self._handle_tool_call(tool_executor, tool_call, context)
+                    for tool_call in tool_calls
+                )):
+                    yield chunk
+
+            if completed:
+                yield DonePayload(
+                    type=StreamChunkType.DONE,
+                    timestamp=now_ms()
+                )
+                            
         except Exception as e:
-            print(f"Ollama provider error: {e}")
-            yield ErrorChunk(
+            logger.exception("Ollama provider error")
+            yield ErrorPayload(
+                type=StreamChunkType.ERROR,
                 error=f"Ollama API error: {str(e)}",
-                timestamp=int(time.time() * 1000)
-            ).dict()
+                timestamp=now_ms()
+            )
 
     async def _fallback_generate(self, session: aiohttp.ClientSession, message: str, context: Optional[ChatContext] = None):
         """Fallback to simple generation API when chat API is not available."""
@@ -109,99 +279,130 @@ class OllamaProvider:
             
             async with session.post(
                 f"{self.base_url}/api/generate",
-                json=request_payload,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
+                data=orjson.dumps(request_payload),
+                headers=JSON_HEADERS
             ) as response:
                 if response.status != 200:
                     raise Exception(f"Ollama generate API error: {response.status}")
                 
-                async for line in response.content:
-                    if line.strip():
-                        try:
-                            data = json.loads(line.decode('utf-8'))
-                            
-                            if 'response' in data and data['response']:
-                                yield AIChunk(
-                                    content=data['response'],
-                                    timestamp=int(time.time() * 1000)
-                                ).dict()
-                            
-                            if data.get('done', False):
-                                yield DoneChunk(
-                                    timestamp=int(time.time() * 1000)
-                                ).dict()
-                                break
-                                
-                        except json.JSONDecodeError:
-                            continue
+                coalescer = _DeltaCoalescer()
+                async for line in coalescer.paced(self._iter_ndjson(response)):
+                    if line is None:
+                        # Upstream is idle; send the text whose window has passed
+                        if text := coalescer.flush():
+                            yield AIChunkPayload(
+                                type=StreamChunkType.AI_CHUNK,
+                                content=text,
+                                timestamp=now_ms()
+                            )
+                        continue
+                    try:
+                        data = orjson.loads(line)
+                        
+                        if 'response' in data and data['response'] and (text := coalescer.add(data['response'])):
+                            yield AIChunkPayload(
+                                type=StreamChunkType.AI_CHUNK,
+                                content=text,
+                                timestamp=now_ms()
+                            )
+                        
+                        if data.get('done', False):
+                            if text := coalescer.flush():
+                                yield AIChunkPayload(
+                                    type=StreamChunkType.AI_CHUNK,
+                                    content=text,
+                                    timestamp=now_ms()
+                                )
+                            yield DonePayload(
+                                type=StreamChunkType.DONE,
+                                timestamp=now_ms()
+                            )
+                            break
                             
+                    except orjson.JSONDecodeError:
+                        continue
+
+                # Stream ended without a done frame
+                if text := coalescer.flush():
+                    yield AIChunkPayload(
+                        type=StreamChunkType.AI_CHUNK,
+                        content=text,
+                        timestamp=now_ms()
+                    )
+                        
         except Exception as e:
-            print(f"Ollama fallback generate error: {e}")
-            yield ErrorChunk(
+            logger.exception("Ollama fallback generate error")
+            yield ErrorPayload(
+                type=StreamChunkType.ERROR,
                 error=f"Ollama generation error: {str(e)}",
-                timestamp=int(time.time() * 1000)
-            ).dict()
+                timestamp=now_ms()
+            )
 
-    async def _handle_tool_call(self, tool_call: Dict, context: Optional[ChatContext] = None):
-        """Handle tool calling with the same pattern as OpenAI provider."""
+    async def _handle_tool_call(self, tool_executor: ToolExecutor, tool_call: Dict, context: Optional[ChatContext] = None) -> Dict[str, Any]:
+        """Execute one tool call and return its result (or error) chunk."""
         try:
             tool_name = tool_call.get('function', {}).get('name')
             arguments = tool_call.get('function', {}).get('arguments', {})
             
             if isinstance(arguments, str):
-                arguments = json.loads(arguments)
+                arguments = orjson.loads(arguments)
             
             # Execute tool
-            tool_result = await get_tool_executor().execute_tool(
+            tool_result = await tool_executor.execute_tool(
                 tool_name,
                 arguments,
                 context=context
             )
             
             if tool_result["success"]:
-                yield ToolResultChunk(
+                return ToolResultPayload(
+                    type=StreamChunkType.TOOL_RESULT,
                     tool=tool_name,
                     result=tool_result["result"],
-                    timestamp=int(time.time() * 1000)
-                ).dict()
+                    timestamp=now_ms()
+                )
             else:
-                yield ErrorChunk(
+                return ErrorPayload(
+                    type=StreamChunkType.ERROR,
                     error=f"Tool execution failed: {tool_result.get('error', 'Unknown error')}",
-                    timestamp=int(time.time() * 1000)
-                ).dict()
+                    timestamp=now_ms()
+                )
                 
         except Exception as e:
-            yield ErrorChunk(
+            return ErrorPayload(
+                type=StreamChunkType.ERROR,
                 error=f"Tool call error: {str(e)}",
-                timestamp=int(time.time() * 1000)
-            ).dict()
+                timestamp=now_ms()
+            )
 
     async def generate_text(self, prompt: str) -> str:
         """Generate text using Ollama API (non-streaming)."""
         try:
-            async with aiohttp.ClientSession() as session:
-                request_payload = {
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False
-                }
+            session = self._get_session()
+            request_payload = {
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False
+            }
                 
+            async with self._semaphore:
                 async with session.post(
                     f"{self.base_url}/api/generate",
-                    json=request_payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    data=orjson.dumps(request_payload),
+                    headers=JSON_HEADERS
                 ) as response:
                     if response.status != 200:
                         raise Exception(f"Ollama API error: {response.status}")
                     
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     content = data.get('response', '').strip()
                     
                     # Clean up any potential markdown formatting
                     if content.startswith('```') and content.endswith('```'):
-                        lines = content.split('\n')
-                        if len(lines) > 2:
-                            content = '\n'.join(lines[1:-1])
+                        first_nl = content.find('\n')
+                        last_nl = content.rfind('\n')
+                        if first_nl != -1 and last_nl > first_nl:
+                            content = content[first_nl + 1:last_nl]
                     
                     return content
                     
@@ -214,58 +415,49 @@ class OllamaProvider:
         context: Optional[ChatContext] = None
     ) -> list:
         """Prepare messages for Ollama API (similar to OpenAI format)."""
-        print(f"DEBUG: Ollama _prepare_messages called with message: {message}")
-        print(f"DEBUG: Context: {context}")
-        if context and context.referenced_files:
-            print(f"DEBUG: Referenced files in context: {context.referenced_files}")
-        
-        system_content = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
-
-Available tools:
-- generate_code: For generating code in any language. Use this when the user asks you to generate code.
-- generate_documentation: For creating a single document (BRD, SRD, README, or API_DOCS).
-- generate_multiple_documentation: For creating multiple documents at once.
-- modify_file_with_diff: PREFERRED for any code improvements, optimizations, or changes. Shows red/green diff for user approval before applying changes.
-- smart_code_action: AI-powered code improvements with automatic strategy selection and diff preview.  
-- comprehensive_code_review: Complete code review with security analysis, quality metrics, and AI insights.
-- security_analysis: Analyze code for security vulnerabilities and weaknesses.
-- analyze_code_structure: Analyze code patterns and structure
-- refactor_code: Basic refactoring (use modify_file_with_diff instead for actual code changes)
-
-IMPORTANT:
-- When asked to generate code, use the `generate_code` tool. For example, if the user asks "Generate me a python function to find the first 20 fibonacci numbers", you should call the `generate_code` tool with the prompt "a python function to find the first 20 fibonacci numbers" and the file_path "fibonacci.py".
-- When asked to generate documentation, use the `generate_documentation` or `generate_multiple_documentation` tools. Infer the `doc_types` from the user's message.
-- When users request code improvements, optimizations, fixes, or changes to files, ALWAYS use 'modify_file_with_diff' to show a visual diff for approval.
-
-Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_prepare_messages: message=%r context=%r", message, context)
 
         messages = [
             {
                 "role": "system",
-                "content": system_content
+                "content": SYSTEM_PROMPT
             }
         ]
 
-        # Add context if provided
+        # Add context if provided; segments are written straight into one
+        # buffer so large file contents are not copied into f-strings first
         if context:
-            context_parts = []
+            buf = io.StringIO()
             
             if context.file_path and context.code_content:
-                context_parts.append(f"Current file: {context.file_path}")
-                context_parts.append(f"Current code:\n```\n{context.code_content}\n```")
+                buf.write("Current file: ")
+                buf.write(context.file_path)
+                buf.write("\n\nCurrent code:\n```\n")
+                buf.write(context.code_content)
+                buf.write("\n```")
             
             if context.working_directory:
-                context_parts.append(f"Working directory: {context.working_directory}")
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write("Working directory: ")
+                buf.write(context.working_directory)
             
             if context.referenced_files:
-                context_parts.append("Referenced files:")
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write("Referenced files:")
                 for file_path, content in context.referenced_files.items():
-                    context_parts.append(f"\n{file_path}:\n```\n{content}\n```")
+                    buf.write("\n\n\n")
+                    buf.write(file_path)
+                    buf.write(":\n```\n")
+                    buf.write(content)
+                    buf.write("\n```")
             
-            if context_parts:
+            if buf.tell():
                 messages.append({
                     "role": "user",
-                    "content": "\n\n".join(context_parts)
+                    "content": buf.getvalue()
                 })
 
         # Add the main user message
@@ -278,38 +470,54 @@ Use tools when appropriate to help users with their coding tasks. Always provide
 
     def _prepare_prompt_with_context(self, message: str, context: Optional[ChatContext] = None) -> str:
         """Prepare a single prompt with context for fallback generation."""
-        prompt_parts = []
+        buf = io.StringIO()
         
         # Add system instructions
-        prompt_parts.append("You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.")
+        buf.write("You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.")
         
         # Add context if provided
         if context:
             if context.file_path and context.code_content:
-                prompt_parts.append(f"\nCurrent file: {context.file_path}")
-                prompt_parts.append(f"Current code:\n```\n{context.code_content}\n```")
+                buf.write("\n\nCurrent file: ")
+                buf.write(context.file_path)
+                buf.write("\nCurrent code:\n```\n")
+                buf.write(context.code_content)
+                buf.write("\n```")
             
             if context.working_directory:
-                prompt_parts.append(f"\nWorking directory: {context.working_directory}")
+                buf.write("\n\nWorking directory: ")
+                buf.write(context.working_directory)
             
             if context.referenced_files:
-                prompt_parts.append("\nReferenced files:")
+                buf.write("\n\nReferenced files:")
                 for file_path, content in context.referenced_files.items():
-                    prompt_parts.append(f"\n{file_path}:\n```\n{content}\n```")
+                    buf.write("\n\n")
+                    buf.write(file_path)
+                    buf.write(":\n```\n")
+                    buf.write(content)
+                    buf.write("\n```")
         
         # Add the main message
-        prompt_parts.append(f"\nUser request: {message}")
+        buf.write("\n\nUser request: ")
+        buf.write(message)
         
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
+
+    def _get_ollama_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Get the Ollama tool schema, converted once per tool registry list."""
+        if self._ollama_tools_source is not tools:
+            self._ollama_tools = self._convert_tools_to_ollama_format(tools)
+            self._ollama_tools_source = tools
+        return self._ollama_tools
 
-    def _convert_tools_to_ollama_format(self, tools: Dict) -> List[Dict]:
+    def _convert_tools_to_ollama_format(self, tools: List[Dict]) -> List[Dict]:
         """Convert OpenAI tool format to Ollama format."""
         ollama_tools = []
-        for tool_name, tool_def in tools.items():
+        for tool_def in tools:
             ollama_tool = {
                 "type": "function",
                 "function": {
-                    "name": tool_name,
+                    "name": tool_def["name"],
                     "description": tool_def.get("description", ""),
                     "parameters": tool_def.get("parameters", {})
                 }
@@ -317,18 +525,75 @@ Use tools when appropriate to help users with their coding tasks. Always provide
             ollama_tools.append(ollama_tool)
         return ollama_tools
 
+    @staticmethod
+    async def _iter_ndjson(response: aiohttp.ClientResponse) -> AsyncGenerator[bytes, None]:
+        """Yield the non-empty lines of an NDJSON body, up to MAX_LINE bytes each."""
+        buf = bytearray()
+        # buf[:scanned] is known to hold no newline, so each byte is searched once
+        scanned = 0
+        async for data, _ in response.content.iter_chunks():
+            buf += data
+            start = 0
+            while (nl := buf.find(b"\n", scanned)) != -1:
+                if nl - start > MAX_LINE:
+                    raise ValueError(f"Ollama stream frame exceeds {MAX_LINE} bytes")
+                line = bytes(buf[start:nl]).strip()
+                start = scanned = nl + 1
+                if line:
+                    yield line
+            if start:
+                del buf[:start]
+            scanned = len(buf)
+            if scanned > MAX_LINE:
+                raise ValueError(f"Ollama stream frame exceeds {MAX_LINE} bytes")
+        line = bytes(buf).strip()
+        if line:
+            yield line
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the keep-alive session, created lazily inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                read_bufsize=READ_BUFSIZE
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the keep-alive session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     async def check_health(self) -> bool:
-        """Check if Ollama service is available."""
+        """Check if Ollama service is available (memoized for HEALTH_TTL seconds)."""
+        ttl = HEALTH_TTL if self._health else UNHEALTHY_TTL
+        if self._health is not None and time.monotonic() - self._health_checked_at < ttl:
+            return self._health
+
+        # Concurrent callers share one in-flight probe; shield it so a
+        # cancelled request doesn't cancel the probe for the others
+        if self._health_probe is None or self._health_probe.done():
+            self._health_probe = asyncio.ensure_future(self._probe_health())
+        return await asyncio.shield(self._health_probe)
+
+    async def _probe_health(self) -> bool:
+        """Probe Ollama's tags endpoint and record the result."""
+        now = time.monotonic()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    return response.status == 200
+            async with self._get_session().get(
+                f"{self.base_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                healthy = response.status == 200
         except Exception:
-            return False
+            healthy = False
+
+        self._health, self._health_checked_at = healthy, now
+        return healthy
 
 
-# Global instance - always create as Ollama doesn't require API keys
-ollama_provider = OllamaProvider()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_ollama_provider() -> OllamaProvider:
+    """Get the shared Ollama provider (always created as Ollama doesn't require API keys)."""
+    return OllamaProvider()
@@ -1,27 +1,67 @@
 """OpenAI provider for AI chat functionality."""
 import asyncio
-import json
-import time
-from typing import AsyncGenerator, Dict, Any, Optional
+import io
+import logging
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, Any, List, Optional
 
+import httpx
 import openai
-from openai import OpenAI
-
-from src.config import settings
-from src.models.streaming import AIChunk, ToolStatusChunk, ToolResultChunk, DoneChunk, ErrorChunk
+import orjson
+from openai import AsyncOpenAI
+
+from src.config import get_settings
+from src.services.http_client import get_async_http_client
+from src.models.streaming import (
+    StreamChunkType,
+    ToolStatus,
+    AIChunkPayload,
+    ToolStatusPayload,
+    ToolResultPayload,
+    DonePayload,
+    ErrorPayload,
+    now_ms,
+)
 from src.models.chat import ChatContext
-from src.services.tool_executor import get_tool_executor, ToolExecutionError
+from src.services.tool_executor import ToolExecutor, get_tool_executor, ToolExecutionError
+
+logger = logging.getLogger(__name__)
+
+# Request-invariant prompt text, built once at import
+SYSTEM_PROMPT = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
+
+Available tools:
+- generate_code: For generating code in any language. Use this when the user asks you to generate code.
+- generate_documentation: For creating a single document (BRD, SRD, README, or API_DOCS).
+- generate_multiple_documentation: For creating multiple documents at once.
+- modify_file_with_diff: PREFERRED for any code improvements, optimizations, or changes. Shows red/green diff for user approval before applying changes.
+- smart_code_action: AI-powered code improvements with automatic strategy selection and diff preview.  
+- comprehensive_code_review: Complete code review with security analysis, quality metrics, and AI insights.
+- security_analysis: Analyze code for security vulnerabilities and weaknesses.
+- analyze_code_structure: Analyze code patterns and structure
+- refactor_code: Basic refactoring (use modify_file_with_diff instead for actual code changes)
+
+IMPORTANT:
+- When asked to generate code, use the `generate_code` tool. For example, if the user asks "Generate me a python function to find the first 20 fibonacci numbers", you should call the `generate_code` tool with the prompt "a python function to find the first 20 fibonacci numbers" and the file_path "fibonacci.py".
+- When asked to generate documentation, use the `generate_documentation` or `generate_multiple_documentation` tools. Infer the `doc_types` from the user's message.
+- When users request code improvements, optimizations, fixes, or changes to files, ALWAYS use 'modify_file_with_diff' to show a visual diff for approval.
+
+Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results."""
 
 
 class OpenAIProvider:
     """OpenAI provider for GPT-4o model."""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        settings = get_settings()
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not configured")
         
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
         self.model = "gpt-4o"
+        self._semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+        self._openai_tools: List[Dict[str, Any]] = []
+        self._openai_tools_source: Optional[List[Dict[str, Any]]] = None
 
     async def stream_chat(
         self, 
@@ -33,140 +73,168 @@ class OpenAIProvider:
             # Prepare messages with context
             messages = self._prepare_messages(message, context)
             
+            # Resolve the shared executor once per request
+            tool_executor = get_tool_executor()
+
             # Get available tools
-            tools = get_tool_executor().get_available_tools()
-            openai_tools = [
-                {"type": "function", "function": tool} 
-                for tool in tools.values()
-            ]
-
-            # Create streaming completion
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
+            openai_tools = self._get_openai_tools(tool_executor.tools_list_cached())
+
+            # Tool calls being streamed this turn, keyed by their delta index
+            pending_tool_calls: Dict[int, Dict[str, Any]] = {}
+            tool_calls: List[Dict[str, Any]] = []
+
+            # Hold a concurrency slot only while the upstream stream is open;
+            # tools run after it is released since they may call the LLM again
+            async with self._semaphore:
+                # Create streaming completion
+                response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
                     tools=openai_tools,
                     tool_choice="auto",
                     stream=True,
-                    temperature=settings.temperature,
-                    max_tokens=settings.max_tokens
+                    temperature=get_settings().temperature,
+                    max_tokens=get_settings().max_tokens
+                )
+
+                async with response:
+                    async for chunk in response:
+                        if not chunk.choices:
+                            continue
+                        # Bind the per-delta fields once; this loop runs for every token
+                        choice = chunk.choices[0]
+                        delta = choice.delta
+                        if not delta:
+                            continue
+
+                        # Handle regular text content
+                        content = delta.content
+                        if content:
+                            yield AIChunkPayload(
+                                type=StreamChunkType.AI_CHUNK,
+                                content=content,
+                                timestamp=now_ms()
+                            )
+
+                        # Handle tool calls
+                        if delta.tool_calls:
+                            for tool_call in delta.tool_calls:
+                                if tool_call.function and tool_call.function.name:
+                                    # New tool call starting
+                                    pending_tool_calls[tool_call.index] = {
+                                        "id": tool_call.id,
+                                        "name": tool_call.function.name,
+                                        "arguments": []
+                                    }
+                                    
+                                    yield ToolStatusPayload(
+                                        type=StreamChunkType.TOOL_STATUS,
+                                        tool=tool_call.function.name,
+                                        status=ToolStatus.EXECUTING,
+                                        timestamp=now_ms()
+                                    )
+
+                                if tool_call.function and tool_call.function.arguments:
+                                    current_tool_call = pending_tool_calls.get(tool_call.index)
+                                    if current_tool_call:
+                                        current_tool_call["arguments"].append(tool_call.function.arguments)
+
+                        # The model has emitted all of the turn's tool calls
+                        if choice.finish_reason == "tool_calls":
+                            tool_calls = [tc for tc in pending_tool_calls.values() if tc["arguments"]]
+                            break
+
+            # Run the turn's tool calls concurrently
+            if tool_calls:
+                results = await asyncio.gather(
+                    *(self._execute_tool_call(tool_executor, tc, context) for tc in tool_calls),
+                    return_exceptions=True
                 )
-            )
 
-            current_tool_call = None
-            tool_arguments = ""
-
-            for chunk in response:
-                delta = chunk.choices[0].delta if chunk.choices else None
-                if not delta:
-                    continue
-
-                # Handle regular text content
-                if delta.content:
-                    yield AIChunk(
-                        content=delta.content,
-                        timestamp=int(time.time() * 1000)
-                    ).dict()
-
-                # Handle tool calls
-                if delta.tool_calls:
-                    for tool_call in delta.tool_calls:
-                        if tool_call.function and tool_call.function.name:
-                            # New tool call starting
-                            current_tool_call = {
-                                "id": tool_call.id,
-                                "name": tool_call.function.name,
-                                "arguments": ""
-                            }
-                            
-                            yield ToolStatusChunk(
-                                tool=tool_call.function.name,
-                                status="executing",
-                                timestamp=int(time.time() * 1000)
-                            ).dict()
-
-                        if tool_call.function and tool_call.function.arguments:
-                            if current_tool_call:
-                                current_tool_call["arguments"] += tool_call.function.arguments
-
-                # Check if tool call is complete
-                if (chunk.choices[0].finish_reason == "tool_calls" and 
-                    current_tool_call and 
-                    current_tool_call["arguments"]):
-                    
-                    try:
-                        # Parse tool arguments
-                        args = json.loads(current_tool_call["arguments"])
-                        
-                        # Execute tool
-                        tool_result = await get_tool_executor().execute_tool(
-                            current_tool_call["name"], 
-                            args,
-                            context=context
+                # Report results in the order the model emitted the calls
+                for current_tool_call, tool_result in zip(tool_calls, results):
+                    if isinstance(tool_result, (orjson.JSONDecodeError, ToolExecutionError)):
+                        yield ErrorPayload(
+                            type=StreamChunkType.ERROR,
+                            error=f"Tool execution failed: {str(tool_result)}",
+                            timestamp=now_ms()
+                        )
+                        continue
+                    if isinstance(tool_result, BaseException):
+                        raise tool_result
+
+                    ts = now_ms()
+                    if tool_result["success"]:
+                        yield ToolResultPayload(
+                            type=StreamChunkType.TOOL_RESULT,
+                            tool=current_tool_call["name"],
+                            result=tool_result["result"],
+                            timestamp=ts
                         )
 
-                        if tool_result["success"]:
-                            yield ToolResultChunk(
-                                tool=current_tool_call["name"],
-                                result=tool_result["result"],
-                                timestamp=int(time.time() * 1000)
-                            ).dict()
-
-                            yield ToolStatusChunk(
-                                tool=current_tool_call["name"],
-                                status="completed",
-                                timestamp=int(time.time() * 1000)
-                            ).dict()
-                        else:
-                            yield ToolStatusChunk(
-                                tool=current_tool_call["name"],
-                                status="failed",
-                                timestamp=int(time.time() * 1000)
-                            ).dict()
-
-                    except (json.JSONDecodeError, ToolExecutionError) as e:
-                        yield ErrorChunk(
-                            error=f"Tool execution failed: {str(e)}",
-                            timestamp=int(time.time() * 1000)
-                        ).dict()
-
-                    current_tool_call = None
+                        yield ToolStatusPayload(
+                            type=StreamChunkType.TOOL_STATUS,
+                            tool=current_tool_call["name"],
+                            status=ToolStatus.COMPLETED,
+                            timestamp=ts
+                        )
+                    else:
+                        yield ToolStatusPayload(
+                            type=StreamChunkType.TOOL_STATUS,
+                            tool=current_tool_call["name"],
+                            status=ToolStatus.FAILED,
+                            timestamp=ts
+                        )
 
             # Send completion signal
-            yield DoneChunk(timestamp=int(time.time() * 1000)).dict()
+            yield DonePayload(type=StreamChunkType.DONE, timestamp=now_ms())
 
         except Exception as e:
-            yield ErrorChunk(
+            yield ErrorPayload(
+                type=StreamChunkType.ERROR,
                 error=f"OpenAI API error: {str(e)}",
-                timestamp=int(time.time() * 1000)
-            ).dict()
+                timestamp=now_ms()
+            )
+
+    def _get_openai_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Get the OpenAI tool schema, wrapped once per tool registry list."""
+        if self._openai_tools_source is not tools:
+            self._openai_tools = [{"type": "function", "function": tool} for tool in tools]
+            self._openai_tools_source = tools
+        return self._openai_tools
+
+    async def _execute_tool_call(
+        self,
+        tool_executor: ToolExecutor,
+        tool_call: Dict[str, Any],
+        context: Optional[ChatContext] = None
+    ) -> Dict[str, Any]:
+        """Parse one streamed tool call's arguments and execute it."""
+        args = orjson.loads("".join(tool_call["arguments"]))
+        return await tool_executor.execute_tool(tool_call["name"], args, context=context)
 
     async def generate_text(self, prompt: str) -> str:
         """Generate text using OpenAI API (non-streaming)."""
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=[{"role": "user", "content": prompt}],
-                    temperature=settings.temperature,
-                    max_tokens=settings.max_tokens
+                    temperature=get_settings().temperature,
+                    max_tokens=get_settings().max_tokens
                 )
-            )
             content = response.choices[0].message.content.strip()
             
             # Additional cleanup to remove any markdown formatting that might slip through
             # Remove code block markers
             if content.startswith('```'):
-                lines = content.split('\n')
-                # Remove first line if it's a code block marker
-                if lines[0].startswith('```'):
-                    lines = lines[1:]
+                # Remove the first line; it's the opening code block marker
+                first_nl = content.find('\n')
+                content = content[first_nl + 1:] if first_nl != -1 else ''
                 # Remove last line if it's a code block marker
-                if lines and lines[-1].strip() == '```':
-                    lines = lines[:-1]
-                content = '\n'.join(lines)
+                last_nl = content.rfind('\n')
+                if content[last_nl + 1:].strip() == '```':
+                    content = content[:last_nl] if last_nl != -1 else ''
             
             return content.strip()
         except Exception as e:
@@ -178,61 +246,48 @@ class OpenAIProvider:
         context: Optional[ChatContext] = None
     ) -> list:
         """Prepare messages for OpenAI API."""
-        print(f"DEBUG: _prepare_messages called with message: {message}")
-        print(f"DEBUG: Context: {context}")
-        if context and context.referenced_files:
-            print(f"DEBUG: Referenced files in context: {context.referenced_files}")
-        
-        system_content = """You are an AI coding assistant for Veltris Codex. You help with code generation, analysis, refactoring, and documentation.
-
-Available tools:
-- generate_code: For generating code in any language. Use this when the user asks you to generate code.
-- generate_documentation: For creating a single document (BRD, SRD, README, or API_DOCS).
-- generate_multiple_documentation: For creating multiple documents at once.
-- modify_file_with_diff: PREFERRED for any code improvements, optimizations, or changes. Shows red/green diff for user approval before applying changes.
-- smart_code_action: AI-powered code improvements with automatic strategy selection and diff preview.  
-- comprehensive_code_review: Complete code review with security analysis, quality metrics, and AI insights.
-- security_analysis: Analyze code for security vulnerabilities and weaknesses.
-- analyze_code_structure: Analyze code patterns and structure
-- refactor_code: Basic refactoring (use modify_file_with_diff instead for actual code changes)
-
-IMPORTANT:
-- When asked to generate code, use the `generate_code` tool. For example, if the user asks "Generate me a python function to find the first 20 fibonacci numbers", you should call the `generate_code` tool with the prompt "a python function to find the first 20 fibonacci numbers" and the file_path "fibonacci.py".
-- When asked to generate documentation, use the `generate_documentation` or `generate_multiple_documentation` tools. Infer the `doc_types` from the user's message.
-- When users request code improvements, optimizations, fixes, or changes to files, ALWAYS use 'modify_file_with_diff' to show a visual diff for approval.
-
-Use tools when appropriate to help users with their coding tasks. Always provide helpful explanations along with tool results."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_prepare_messages: message=%r context=%r", message, context)
 
         messages = [
             {
                 "role": "system",
-                "content": system_content
+                "content": SYSTEM_PROMPT
             }
         ]
 
-        # Add context if provided
+        # Add context if provided; segments are written straight into one
+        # buffer so large file contents are not copied into f-strings first
         if context:
-            context_parts = []
+            buf = io.StringIO()
             
             if context.file_path:
-                context_parts.append(f"File: {context.file_path}")
+                buf.write("\nFile: ")
+                buf.write(context.file_path)
             
             if context.code_content:
-                context_parts.append(f"Code:\n```\n{context.code_content}\n```")
+                buf.write("\nCode:\n```\n")
+                buf.write(context.code_content)
+                buf.write("\n```")
             
             if context.project_structure:
-                context_parts.append(f"Project structure:\n{context.project_structure}")
+                buf.write("\nProject structure:\n")
+                buf.write(context.project_structure)
 
             # Add referenced files content
             if context.referenced_files:
-                context_parts.append("Referenced files:")
+                buf.write("\nReferenced files:")
                 for file_path, content in context.referenced_files.items():
-                    context_parts.append(f"\n@{file_path}:\n```\n{content}\n```")
+                    buf.write("\n\n@")
+                    buf.write(file_path)
+                    buf.write(":\n```\n")
+                    buf.write(content)
+                    buf.write("\n```")
 
-            if context_parts:
+            if buf.tell():
                 messages.append({
                     "role": "user",
-                    "content": f"Current context:\n{chr(10).join(context_parts)}"
+                    "content": "Current context:" + buf.getvalue()
                 })
 
         # Add user message
@@ -246,14 +301,13 @@ Use tools when appropriate to help users with their coding tasks. Always provide
     async def is_available(self) -> bool:
         """Check if OpenAI API is available."""
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.models.list()
-            )
+            await self.client.models.list()
             return True
         except Exception:
             return False
 
 
-# Global provider instance
-openai_provider = OpenAIProvider() if settings.openai_api_key else None
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_openai_provider() -> Optional[OpenAIProvider]:
+    """Get the shared OpenAI provider, or None if no API key is configured."""
+    return OpenAIProvider(http_client=get_async_http_client()) if get_settings().openai_api_key else None
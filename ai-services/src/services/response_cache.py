@@ -0,0 +1,57 @@
+"""Response cache for the public, static-ish endpoints (root, models, health)."""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import Coder
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from src.config import Settings
+
+
+class ORJSONCoder(Coder):
+    """Encode cached payloads with orjson."""
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, JSONResponse):
+            return value.body
+        return orjson.dumps(value, default=jsonable_encoder)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+def endpoint_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Key cached responses by endpoint and query string only.
+
+    The injected providers and settings are per-process objects, so including
+    them (as the default key builder does) would give every worker its own key.
+    """
+    query = request.url.query if request else ""
+    return f"{namespace}:{func.__module__}:{func.__name__}:{query}"
+
+
+def init_response_cache(settings: Settings) -> None:
+    """Initialize the response cache, using Redis when REDIS_URL is configured."""
+    if settings.redis_url:
+        from fastapi_cache.backends.redis import RedisBackend
+        from redis import asyncio as aioredis
+
+        backend = RedisBackend(aioredis.from_url(settings.redis_url))
+    else:
+        backend = InMemoryBackend()
+
+    FastAPICache.init(backend, prefix="codex", coder=ORJSONCoder, key_builder=endpoint_key_builder)
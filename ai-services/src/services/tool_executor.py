@@ -1,6 +1,12 @@
-from typing import Any, Dict, Union
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Type, Union
 
-from pydantic import ValidationError
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from src.models.tools import (
     CodeDiffParams,
@@ -8,20 +14,297 @@ from src.models.tools import (
     MultiDocumentationParams,
     CodeAnalysisParams,
     RefactorParams,
-    GenerateCodeParams,
+    MultiGenerateCodeParams,
     FileModificationParams,
+    ListDirectoryParams,
+    ReadFileParams,
+    WriteFileParams,
 )
 from src.services.tools.code_diff import code_diff_service
 from src.services.tools.doc_generator import DocumentationService
 from src.services.tools.code_analyzer import code_analyzer
 from src.services.tools.refactor import code_refactor_service
-from src.services.tools.file_system import list_directory, read_file, write_file
+from src.services.tools.file_system import list_directory, read_file, stream_directory, write_file
 from src.services.tools.code_generator import CodeGeneratorService
 from src.services.tools.file_modification import FileModificationService
 from src.services.tools.smart_action_service import SmartCodeActionService
 from src.services.tools.security_analyzer import security_analyzer
 from src.services.tools.code_review_service import CodeReviewService
 
+logger = logging.getLogger(__name__)
+
+
+# Tool schemas offered to the models; static, so built once at import
+AVAILABLE_TOOLS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "generate_code_diff": {
+        "name": "generate_code_diff",
+        "description": "Generate and display code differences",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "old_code": {
+                    "type": "string",
+                    "description": "Original version of the code"
+                },
+                "new_code": {
+                    "type": "string",
+                    "description": "Updated version of the code"
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Programming language (optional)"
+                }
+            },
+            "required": ["old_code", "new_code"]
+        }
+    },
+    "generate_documentation": {
+        "name": "generate_documentation",
+        "description": "Generate technical documentation like BRD, SRD, or README",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "doc_type": {
+                    "type": "string",
+                    "enum": ["BRD", "SRD", "README", "API_DOCS"],
+                    "description": "Type of documentation to generate"
+                },
+                "project_context": {
+                    "type": "string",
+                    "description": "Project-level description, user goal, or business purpose"
+                },
+                "code_structure": {
+                    "type": "string",
+                    "description": "Description of file structure or key components (optional)"
+                }
+            },
+            "required": ["doc_type", "project_context"]
+        }
+    },
+    "generate_multiple_documentation": {
+        "name": "generate_multiple_documentation",
+        "description": "Generate multiple types of technical documentation (BRD, SRD, README, API_DOCS) in one request",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "doc_types": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["BRD", "SRD", "README", "API_DOCS"]
+                    },
+                    "description": "List of documentation types to generate"
+                },
+                "project_context": {
+                    "type": "string",
+                    "description": "Project-level description, user goal, or business purpose"
+                },
+                "code_structure": {
+                    "type": "string",
+                    "description": "Description of file structure or key components (optional)"
+                }
+            },
+            "required": ["doc_types", "project_context"]
+        }
+    },
+    "analyze_code_structure": {
+        "name": "analyze_code_structure",
+        "description": "Analyze a file or project to detect patterns and structure",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Relative file path"
+                },
+                "code_content": {
+                    "type": "string",
+                    "description": "Source code to analyze"
+                }
+            },
+            "required": ["file_path", "code_content"]
+        }
+    },
+    "refactor_code": {
+        "name": "refactor_code",
+        "description": "Refactor code with a specific strategy",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "original_code": {
+                    "type": "string",
+                    "description": "The source code to be refactored"
+                },
+                "refactor_type": {
+                    "type": "string",
+                    "enum": ["optimize", "modernize", "add_types", "extract_components"],
+                    "description": "The type of refactoring to apply"
+                }
+            },
+            "required": ["original_code", "refactor_type"]
+        }
+    },
+    "write_file": {
+        "name": "write_file",
+        "description": "Writes content to a specified file.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "The path to the file to write (relative to project root)"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The content to write to the file"
+                }
+            },
+            "required": ["file_path", "content"]
+        }
+    },
+    "generate_code": {
+        "name": "generate_code",
+        "description": "Generates code for multiple files based on a list of prompts and saves them to specified file paths.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "description": "A list of code generation requests.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "prompt": {
+                                "type": "string",
+                                "description": "Natural language description of the code to generate for this item"
+                            },
+                            "file_path": {
+                                "type": "string",
+                                "description": "The specific file path (relative to project root) where this code should be saved"
+                            },
+                            "language": {
+                                "type": "string",
+                                "description": "Programming language for this code item (e.g., python, javascript, typescript)"
+                            }
+                        },
+                        "required": ["prompt", "file_path"]
+                    }
+                }
+            },
+            "required": ["items"]
+        }
+    },
+    "modify_file_with_diff": {
+        "name": "modify_file_with_diff",
+        "description": "Modify an existing file with AI assistance and generate a diff for user approval. Use this when the user wants to make changes to a specific file.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to modify (relative to project root)"
+                },
+                "modification_request": {
+                    "type": "string",
+                    "description": "Description of the changes to make to the file"
+                },
+                "current_content": {
+                    "type": "string",
+                    "description": "Current file content (optional, will be auto-fetched if not provided)"
+                }
+            },
+            "required": ["file_path", "modification_request"]
+        }
+    },
+    "smart_code_action": {
+        "name": "smart_code_action",
+        "description": "Perform intelligent code improvements based on natural language requests. Can optimize code, add type hints, modernize syntax, add error handling, etc.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to improve"
+                },
+                "action_request": {
+                    "type": "string", 
+                    "description": "Natural language description of the improvement to make (e.g., 'optimize for performance', 'add type hints', 'add error handling')"
+                },
+                "file_content": {
+                    "type": "string",
+                    "description": "Current file content (optional, will be auto-fetched if not provided)"
+                }
+            },
+            "required": ["file_path", "action_request"]
+        }
+    },
+    "security_analysis": {
+        "name": "security_analysis",
+        "description": "Perform comprehensive security analysis to find vulnerabilities, weak cryptography, and security issues",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to analyze for security issues"
+                },
+                "code_content": {
+                    "type": "string",
+                    "description": "Source code to analyze for security vulnerabilities"
+                }
+            },
+            "required": ["file_path", "code_content"]
+        }
+    },
+    "comprehensive_code_review": {
+        "name": "comprehensive_code_review", 
+        "description": "Perform a comprehensive code review combining security analysis, code quality metrics, and AI insights",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to review"
+                },
+                "file_content": {
+                    "type": "string",
+                    "description": "Source code content (optional, will be auto-fetched if not provided)"
+                },
+                "review_focus": {
+                    "type": "string",
+                    "enum": ["all", "security", "performance", "maintainability", "style"],
+                    "description": "Focus area for the review (default: all)"
+                }
+            },
+            "required": ["file_path"]
+        }
+    }
+})
+
+# SecurityIssue fields reported by security_analysis, in response order
+_ISSUE_FIELDS = (
+    "severity",
+    "category",
+    "description",
+    "line_number",
+    "code_snippet",
+    "recommendation",
+    "cwe_id",
+)
+
+# Tools whose result depends only on their parameters; these results are
+# memoized. Tools that read or write files or call an LLM are never cached.
+# analyze_code_structure is left out: CodeAnalyzer already memoizes its
+# analyses for every caller, including the review and smart action services.
+CACHEABLE_TOOLS = frozenset({
+    "generate_code_diff",
+    "refactor_code",
+    "security_analysis",
+})
+
+# Bound on memoized tool results per worker
+RESULT_CACHE_SIZE = 256
+
 
 class ToolExecutionError(Exception):
     """Exception raised when tool execution fails."""
@@ -34,15 +317,17 @@ class ToolExecutor:
     def __init__(self, openai_provider: Any, claude_provider: Any):
         self.code_generator_service = CodeGeneratorService(openai_provider, claude_provider)
         self.file_modification_service = FileModificationService(openai_provider, claude_provider)
-        self.smart_action_service = SmartCodeActionService(openai_provider, claude_provider)
+        self.smart_action_service = SmartCodeActionService(openai_provider, claude_provider, self.file_modification_service)
         self.code_review_service = CodeReviewService(openai_provider, claude_provider)
         self.documentation_service = DocumentationService(openai_provider, claude_provider)
         self.tools = {
-            "generate_code_diff": self._execute_code_diff,
-            "generate_documentation": self._execute_documentation,
+            # Tools that validate one params model and return one result model
+            # share a single dispatcher, bound here per tool
+            "generate_code_diff": partial(self._execute_validated, CodeDiffParams, code_diff_service.generate_diff),
+            "generate_documentation": partial(self._execute_validated, DocumentationParams, self.documentation_service.generate_documentation),
             "generate_multiple_documentation": self._execute_multiple_documentation,
-            "analyze_code_structure": self._execute_code_analysis,
-            "refactor_code": self._execute_refactor,
+            "analyze_code_structure": partial(self._execute_validated, CodeAnalysisParams, code_analyzer.analyze_code),
+            "refactor_code": partial(self._execute_validated, RefactorParams, code_refactor_service.refactor_code),
             "list_directory": self._execute_list_directory,
             "read_file": self._execute_read_file,
             "write_file": self._execute_write_file,
@@ -52,423 +337,165 @@ class ToolExecutor:
             "security_analysis": self._execute_security_analysis,
             "comprehensive_code_review": self._execute_comprehensive_code_review,
         }
+        self._tools_list: Optional[List[Dict[str, Any]]] = None
+        self._results: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # Tools whose result is a list that can be sent while it is produced
+        self.stream_tools = {
+            "list_directory": self._stream_list_directory,
+        }
 
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any], context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute a tool with given parameters."""
-        if tool_name not in self.tools:
+        tool_func = self.tools.get(tool_name)
+        if tool_func is None:
             raise ToolExecutionError(f"Unknown tool: {tool_name}")
 
+        cache_key = self._result_key(tool_name, parameters) if tool_name in CACHEABLE_TOOLS else None
+        if cache_key is not None:
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                self._results.move_to_end(cache_key)
+                return {"success": True, "result": cached, "tool_name": tool_name}
+
+        # Passed alongside the parameters so the caller's dict is never modified
+        working_directory = context.working_directory if context is not None else None
+        # Tools raise freely; errors are wrapped in ToolExecutionError only here
         try:
-            # Add working_directory to parameters if it exists in the context
-            if context and context.working_directory:
-                parameters['working_directory'] = context.working_directory
-                print(f"DEBUG: Working directory in tool executor: {context.working_directory}")
-
-            tool_func = self.tools[tool_name]
-            result = await tool_func(parameters)
-            
+            if working_directory:
+                logger.debug("Working directory in tool executor: %s", working_directory)
+
+            result = await tool_func(parameters, working_directory)
+            if cache_key is not None:
+                self._store_result(cache_key, result)
+
             return {
                 "success": True,
                 "result": result,
                 "tool_name": tool_name
             }
+        except ToolExecutionError:
+            raise
         except ValidationError as e:
-            raise ToolExecutionError(f"Parameter validation failed: {e}")
+            raise ToolExecutionError(f"Parameter validation failed: {e}") from e
         except Exception as e:
-            raise ToolExecutionError(f"Tool execution failed: {str(e)}")
+            raise ToolExecutionError(f"Tool execution failed: {e}") from e
 
-    async def _execute_code_diff(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute code diff tool."""
-        try:
-            params = CodeDiffParams(**parameters)
-            result = await code_diff_service.generate_diff(params)
-            return result.dict()
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for code diff: {e}")
+    @staticmethod
+    def _result_key(tool_name: str, parameters: Dict[str, Any]) -> bytes:
+        """Hash a tool call into a result cache key."""
+        digest = hashlib.blake2b(tool_name.encode(), digest_size=16)
+        digest.update(orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS))
+        return digest.digest()
 
-    async def _execute_documentation(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute documentation generation tool."""
-        try:
-            params = DocumentationParams(**parameters)
-            result = await self.documentation_service.generate_documentation(params)
-            return result.dict()
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for documentation: {e}")
+    def _store_result(self, cache_key: bytes, result: Dict[str, Any]) -> None:
+        """Memoize a tool result (shared; do not mutate), evicting the least recently used."""
+        self._results[cache_key] = result
+        self._results.move_to_end(cache_key)
+        if len(self._results) > RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
 
-    async def _execute_multiple_documentation(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute multiple documentation generation tool."""
-        try:
-            print(f"DEBUG: Executing multiple documentation with parameters: {parameters}")
-            working_directory = parameters.pop('working_directory', None)
-            params = MultiDocumentationParams(**parameters)
-            results = await self.documentation_service.generate_multiple_documentation(params, working_directory)
-            return {"results": results}
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for multiple documentation: {e}")
+    async def execute_tool_stream(self, tool_name: str, parameters: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Validate parameters and return an iterator over a streamable tool's result items."""
+        stream_func = self.stream_tools.get(tool_name)
+        if stream_func is None:
+            raise ToolExecutionError(f"Tool does not support streaming: {tool_name}")
 
-    async def _execute_code_analysis(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute code analysis tool."""
         try:
-            params = CodeAnalysisParams(**parameters)
-            result = await code_analyzer.analyze_code(params)
-            return result.dict()
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for code analysis: {e}")
+            return await stream_func(parameters)
+        except Exception as e:
+            raise ToolExecutionError(f"Tool execution failed: {e}") from e
 
-    async def _execute_refactor(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute code refactoring tool."""
-        try:
-            params = RefactorParams(**parameters)
-            result = await code_refactor_service.refactor_code(params)
-            return result.dict()
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for refactoring: {e}")
+    async def _execute_validated(
+        self,
+        model: Type[BaseModel],
+        func: Callable[[Any], Awaitable[BaseModel]],
+        parameters: Dict[str, Any],
+        working_directory: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Validate parameters as model, run func on them and dump its result."""
+        params = model.model_validate(parameters)
+        result = await func(params)
+        return result.model_dump()
+
+    async def _execute_multiple_documentation(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
+        """Execute multiple documentation generation tool."""
+        logger.debug("Executing multiple documentation for %s", parameters.get("doc_types"))
+        params = MultiDocumentationParams.model_validate(parameters)
+        results = await self.documentation_service.generate_multiple_documentation(params, working_directory)
+        return {"results": results}
 
-    async def _execute_list_directory(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_list_directory(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute list directory tool."""
-        try:
-            return await list_directory(parameters.get('path', '.'))
-        except Exception as e:
-            raise ToolExecutionError(f"Tool execution failed: {str(e)}")
+        params = ListDirectoryParams.model_validate(parameters)
+        return await list_directory(params.path)
 
-    async def _execute_read_file(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _stream_list_directory(self, parameters: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the top-level directory entries."""
+        params = ListDirectoryParams.model_validate(parameters)
+        return await stream_directory(params.path)
+
+    async def _execute_read_file(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute read file tool."""
-        try:
-            return await read_file(parameters.get('absolute_path'), parameters.get('base_path'))
-        except Exception as e:
-            raise ToolExecutionError(f"Tool execution failed: {str(e)}")
+        params = ReadFileParams.model_validate(parameters)
+        return await read_file(params.absolute_path, params.base_path)
 
-    async def _execute_write_file(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_write_file(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute write file tool."""
-        print(f"DEBUG: Executing write_file with parameters: {parameters}")
-        try:
-            return await write_file(parameters.get('file_path'), parameters.get('content'), parameters.get('base_path'))
-        except Exception as e:
-            print(f"DEBUG: Error in _execute_write_file: {e}")
-            raise ToolExecutionError(f"Tool execution failed: {str(e)}")
+        params = WriteFileParams.model_validate(parameters)
+        logger.debug("Executing write_file for %s", params.file_path)
+        return await write_file(params.file_path, params.content, params.base_path)
 
-    async def _execute_generate_code(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_generate_code(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute generate code tool."""
-        print(f"DEBUG: Executing generate_code with parameters: {parameters}")
-        try:
-            working_directory = parameters.pop('working_directory', None)
-            params = GenerateCodeParams(**parameters)
-            result = await self.code_generator_service.generate_code(params, working_directory)
-            return result
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for code generation: {e}")
-        except Exception as e:
-            print(f"DEBUG: Error in _execute_generate_code: {e}")
-            raise ToolExecutionError(f"Tool execution failed: {str(e)}")
+        logger.debug("Executing generate_code in %s", working_directory)
+        params = MultiGenerateCodeParams.model_validate(parameters)
+        return await self.code_generator_service.generate_code(params, working_directory)
 
-    async def _execute_file_modification(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_file_modification(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute file modification with diff tool."""
-        try:
-            params = FileModificationParams(**parameters)
-            result = await self.file_modification_service.modify_file_with_diff(params)
-            return result.dict()
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for file modification: {e}")
-        except Exception as e:
-            raise ToolExecutionError(f"File modification failed: {str(e)}")
+        params = FileModificationParams.model_validate(parameters)
+        result = await self.file_modification_service.modify_file_with_diff(params)
+        return result.model_dump()
 
-    async def _execute_smart_code_action(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_smart_code_action(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute smart code action."""
-        try:
-            result = await self.smart_action_service.perform_smart_action(parameters)
-            return result
-        except Exception as e:
-            raise ToolExecutionError(f"Smart code action failed: {str(e)}")
+        return await self.smart_action_service.perform_smart_action(parameters)
 
-    async def _execute_security_analysis(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_security_analysis(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute security analysis."""
-        try:
-            params = CodeAnalysisParams(**parameters)
-            result = await security_analyzer.analyze_security(params)
-            return {
-                "success": True,
-                "issues": [
-                    {
-                        "severity": issue.severity,
-                        "category": issue.category,
-                        "description": issue.description,
-                        "line_number": issue.line_number,
-                        "code_snippet": issue.code_snippet,
-                        "recommendation": issue.recommendation,
-                        "cwe_id": issue.cwe_id
-                    } for issue in result.issues
-                ],
-                "security_score": result.security_score,
-                "summary": result.summary,
-                "recommendations": result.recommendations
-            }
-        except ValidationError as e:
-            raise ToolExecutionError(f"Invalid parameters for security analysis: {e}")
-        except Exception as e:
-            raise ToolExecutionError(f"Security analysis failed: {str(e)}")
+        params = CodeAnalysisParams.model_validate(parameters)
+        result = await security_analyzer.analyze_security(params)
+        return {
+            "success": True,
+            "issues": [{field: getattr(issue, field) for field in _ISSUE_FIELDS} for issue in result.issues],
+            "security_score": result.security_score,
+            "summary": result.summary,
+            "recommendations": result.recommendations
+        }
 
-    async def _execute_comprehensive_code_review(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_comprehensive_code_review(self, parameters: Dict[str, Any], working_directory: Optional[str] = None) -> Dict[str, Any]:
         """Execute comprehensive code review."""
-        try:
-            result = await self.code_review_service.perform_comprehensive_review(parameters)
-            return result
-        except Exception as e:
-            raise ToolExecutionError(f"Code review failed: {str(e)}")
+        return await self.code_review_service.perform_comprehensive_review(parameters)
 
-    def get_available_tools(self) -> Dict[str, Dict[str, Any]]:
-        """Get list of available tools with their schemas."""
-        return {
-            "generate_code_diff": {
-                "name": "generate_code_diff",
-                "description": "Generate and display code differences",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "old_code": {
-                            "type": "string",
-                            "description": "Original version of the code"
-                        },
-                        "new_code": {
-                            "type": "string",
-                            "description": "Updated version of the code"
-                        },
-                        "language": {
-                            "type": "string",
-                            "description": "Programming language (optional)"
-                        }
-                    },
-                    "required": ["old_code", "new_code"]
-                }
-            },
-            "generate_documentation": {
-                "name": "generate_documentation",
-                "description": "Generate technical documentation like BRD, SRD, or README",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "doc_type": {
-                            "type": "string",
-                            "enum": ["BRD", "SRD", "README", "API_DOCS"],
-                            "description": "Type of documentation to generate"
-                        },
-                        "project_context": {
-                            "type": "string",
-                            "description": "Project-level description, user goal, or business purpose"
-                        },
-                        "code_structure": {
-                            "type": "string",
-                            "description": "Description of file structure or key components (optional)"
-                        }
-                    },
-                    "required": ["doc_type", "project_context"]
-                }
-            },
-            "generate_multiple_documentation": {
-                "name": "generate_multiple_documentation",
-                "description": "Generate multiple types of technical documentation (BRD, SRD, README, API_DOCS) in one request",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "doc_types": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                                "enum": ["BRD", "SRD", "README", "API_DOCS"]
-                            },
-                            "description": "List of documentation types to generate"
-                        },
-                        "project_context": {
-                            "type": "string",
-                            "description": "Project-level description, user goal, or business purpose"
-                        },
-                        "code_structure": {
-                            "type": "string",
-                            "description": "Description of file structure or key components (optional)"
-                        }
-                    },
-                    "required": ["doc_types", "project_context"]
-                }
-            },
-            "analyze_code_structure": {
-                "name": "analyze_code_structure",
-                "description": "Analyze a file or project to detect patterns and structure",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Relative file path"
-                        },
-                        "code_content": {
-                            "type": "string",
-                            "description": "Source code to analyze"
-                        }
-                    },
-                    "required": ["file_path", "code_content"]
-                }
-            },
-            "refactor_code": {
-                "name": "refactor_code",
-                "description": "Refactor code with a specific strategy",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "original_code": {
-                            "type": "string",
-                            "description": "The source code to be refactored"
-                        },
-                        "refactor_type": {
-                            "type": "string",
-                            "enum": ["optimize", "modernize", "add_types", "extract_components"],
-                            "description": "The type of refactoring to apply"
-                        }
-                    },
-                    "required": ["original_code", "refactor_type"]
-                }
-            },
-            "write_file": {
-                "name": "write_file",
-                "description": "Writes content to a specified file.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "The path to the file to write (relative to project root)"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "The content to write to the file"
-                        }
-                    },
-                    "required": ["file_path", "content"]
-                }
-            },
-            "generate_code": {
-                "name": "generate_code",
-                "description": "Generates code for multiple files based on a list of prompts and saves them to specified file paths.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "items": {
-                            "type": "array",
-                            "description": "A list of code generation requests.",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "prompt": {
-                                        "type": "string",
-                                        "description": "Natural language description of the code to generate for this item"
-                                    },
-                                    "file_path": {
-                                        "type": "string",
-                                        "description": "The specific file path (relative to project root) where this code should be saved"
-                                    },
-                                    "language": {
-                                        "type": "string",
-                                        "description": "Programming language for this code item (e.g., python, javascript, typescript)"
-                                    }
-                                },
-                                "required": ["prompt", "file_path"]
-                            }
-                        }
-                    },
-                    "required": ["items"]
-                }
-            },
-            "modify_file_with_diff": {
-                "name": "modify_file_with_diff",
-                "description": "Modify an existing file with AI assistance and generate a diff for user approval. Use this when the user wants to make changes to a specific file.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to modify (relative to project root)"
-                        },
-                        "modification_request": {
-                            "type": "string",
-                            "description": "Description of the changes to make to the file"
-                        },
-                        "current_content": {
-                            "type": "string",
-                            "description": "Current file content (optional, will be auto-fetched if not provided)"
-                        }
-                    },
-                    "required": ["file_path", "modification_request"]
-                }
-            },
-            "smart_code_action": {
-                "name": "smart_code_action",
-                "description": "Perform intelligent code improvements based on natural language requests. Can optimize code, add type hints, modernize syntax, add error handling, etc.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to improve"
-                        },
-                        "action_request": {
-                            "type": "string", 
-                            "description": "Natural language description of the improvement to make (e.g., 'optimize for performance', 'add type hints', 'add error handling')"
-                        },
-                        "file_content": {
-                            "type": "string",
-                            "description": "Current file content (optional, will be auto-fetched if not provided)"
-                        }
-                    },
-                    "required": ["file_path", "action_request"]
-                }
-            },
-            "security_analysis": {
-                "name": "security_analysis",
-                "description": "Perform comprehensive security analysis to find vulnerabilities, weak cryptography, and security issues",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to analyze for security issues"
-                        },
-                        "code_content": {
-                            "type": "string",
-                            "description": "Source code to analyze for security vulnerabilities"
-                        }
-                    },
-                    "required": ["file_path", "code_content"]
-                }
-            },
-            "comprehensive_code_review": {
-                "name": "comprehensive_code_review", 
-                "description": "Perform a comprehensive code review combining security analysis, code quality metrics, and AI insights",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to review"
-                        },
-                        "file_content": {
-                            "type": "string",
-                            "description": "Source code content (optional, will be auto-fetched if not provided)"
-                        },
-                        "review_focus": {
-                            "type": "string",
-                            "enum": ["all", "security", "performance", "maintainability", "style"],
-                            "description": "Focus area for the review (default: all)"
-                        }
-                    },
-                    "required": ["file_path"]
-                }
-            }
-        }
+    def tools_list_cached(self) -> List[Dict[str, Any]]:
+        """Get the tool schemas as a list; the same list object is returned until invalidate()."""
+        if self._tools_list is None:
+            self._tools_list = list(self.get_available_tools().values())
+        return self._tools_list
+
+    def invalidate(self) -> None:
+        """Drop the cached tool schemas, e.g. after the tool registry is reloaded."""
+        self._tools_list = None
 
+    def get_available_tools(self) -> Mapping[str, Dict[str, Any]]:
+        """Get the available tools with their schemas (shared; do not mutate)."""
+        return AVAILABLE_TOOLS
 
-# Global tool executor instance will be set in main.py
-tool_executor = None
+@lru_cache(maxsize=1)
+def get_tool_executor() -> ToolExecutor:
+    """Get the shared tool executor, wired to the shared AI providers on first use."""
+    # Imported here as the providers themselves depend on this module
+    from src.services.providers.openai_provider import get_openai_provider
+    from src.services.providers.claude_provider import get_claude_provider
 
-def get_tool_executor():
-    """Get the global tool executor instance."""
-    if tool_executor is None:
-        raise RuntimeError("Tool executor not initialized. Call set_tool_executor() first.")
-    return tool_executor
\ No newline at end of file
+    return ToolExecutor(get_openai_provider(), get_claude_provider())
@@ -1,6 +1,9 @@
 """Code analysis service."""
 import ast
+import asyncio
+import hashlib
 import re
+from collections import OrderedDict
 from typing import List, Optional
 
 from src.models.tools import (
@@ -10,22 +13,184 @@ from src.models.tools import (
     CodeMetrics,
 )
 
+# Bound on memoized analysis results per worker
+ANALYSIS_CACHE_SIZE = 128
+
+# Node types that each add one decision point to cyclomatic complexity;
+# matched by exact type with one set lookup per node
+_COMPLEXITY_TYPES = frozenset({
+    ast.If,
+    ast.While,
+    ast.For,
+    ast.AsyncFor,
+    ast.ExceptHandler,
+    ast.With,
+    ast.AsyncWith,
+})
+
+# Regexes for the generic (non-Python) analysis, compiled once at import
+_FUNCTION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'function\s+(\w+)',  # JavaScript
+    r'def\s+(\w+)',       # Python
+    r'const\s+(\w+)\s*=\s*(?:async\s+)?\(',  # JavaScript arrow functions
+    r'(\w+)\s*:\s*(?:async\s+)?\(',  # TypeScript
+    r'(?:public|private|protected)?\s*(?:static\s+)?(?:async\s+)?(?:\w+\s+)?(\w+)\s*\(',  # Java/C#
+))
+
+_CLASS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'class\s+(\w+)',
+    r'interface\s+(\w+)',
+    r'struct\s+(\w+)',
+    r'enum\s+(\w+)',
+))
+
+_IMPORT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'import\s+(?:{[^}]+}|\w+|\*\s+as\s+\w+)\s+from\s+[\'"`]([^\'"`]+)[\'"`]',
+    r'from\s+(\w+)\s+import',
+    r'#include\s*<([^>]+)>',
+    r'using\s+(\w+);',
+))
+
+_EXPORT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'export\s+(?:default\s+)?(?:class\s+(\w+)|function\s+(\w+)|const\s+(\w+))',
+    r'module\.exports\s*=\s*(\w+)',
+))
+
+# Branching keywords and operators in one alternation, so the source is
+# scanned once; operators count wherever they appear, spaced or not
+_COMPLEXITY_RE = re.compile(r'\b(?:if|else|while|for|switch|case|catch)\b|&&|\|\||\?', re.IGNORECASE)
+
+# Markers the generic suggestions look for, found in one scan; none of the
+# alternatives can overlap, so each occurrence reports its own group
+_SUGGESTION_RE = re.compile(r'(?P<todo>TODO|FIXME)|(?P<comment>/\*\*|\*/|//)|(?P<console>console\.log\()|(?P<var>\bvar\s+)')
+_SUGGESTION_GROUPS = frozenset(_SUGGESTION_RE.groupindex)
+
+# Splits an import into the name parts matched against _FRAMEWORK_PATTERNS
+_IMPORT_NAME_SPLIT_RE = re.compile(r'[._]')
+
+# Module name part -> framework pattern, in reporting order
+_FRAMEWORK_PATTERNS = {
+    "django": "Django Framework",
+    "flask": "Flask Framework",
+    "fastapi": "FastAPI Framework",
+    "pytest": "pytest Testing",
+    "numpy": "NumPy Data Processing",
+    "pandas": "Pandas Data Analysis",
+    "asyncio": "Asyncio Async Programming",
+}
+
+
+class _PythonCollector:
+    """Facts about a Python AST, gathered in a single ast.walk.
+
+    The walk is breadth-first like the separate passes it replaces, so names
+    and suggestions keep their order.
+    """
+
+    __slots__ = (
+        "functions",
+        "classes",
+        "imports",
+        "long_functions",
+        "missing_docstrings",
+        "has_untyped_function",
+        "has_async",
+        "has_try",
+        "has_with",
+        "has_list_comp",
+        "has_lambda",
+        "complexity",
+    )
+
+    def __init__(self, tree: ast.AST):
+        self.functions: List[str] = []
+        self.classes: List[str] = []
+        self.imports: List[str] = []
+        self.long_functions: List[str] = []
+        self.missing_docstrings: List[str] = []
+        self.has_untyped_function = False
+        self.has_async = False
+        self.has_try = False
+        self.has_with = False
+        self.has_list_comp = False
+        self.has_lambda = False
+        self.complexity = 1  # Base complexity
+
+        for node in ast.walk(tree):
+            node_type = type(node)
+            if node_type in _COMPLEXITY_TYPES:
+                self.complexity += 1
+            elif node_type is ast.BoolOp:
+                self.complexity += len(node.values) - 1
+
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if isinstance(node, ast.AsyncFunctionDef):
+                    self.functions.append(f"async {node.name}")
+                    self.has_async = True
+                else:
+                    self.functions.append(node.name)
+                lines = node.end_lineno - node.lineno
+                if lines > 50:
+                    self.long_functions.append(f"Function '{node.name}' is too long ({lines} lines). Consider breaking it down.")
+                if not ast.get_docstring(node):
+                    self.missing_docstrings.append(f"Add docstring to {node.__class__.__name__.lower()} '{node.name}'")
+                if not node.returns and node.name != "__init__":
+                    self.has_untyped_function = True
+            elif isinstance(node, ast.ClassDef):
+                self.classes.append(node.name)
+                if not ast.get_docstring(node):
+                    self.missing_docstrings.append(f"Add docstring to classdef '{node.name}'")
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    self.imports.append(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    self.imports.append(node.module)
+            elif isinstance(node, ast.Try):
+                self.has_try = True
+            elif isinstance(node, ast.With):
+                self.has_with = True
+            elif isinstance(node, ast.ListComp):
+                self.has_list_comp = True
+            elif isinstance(node, ast.Lambda):
+                self.has_lambda = True
+
 
 class CodeAnalyzer:
     """Service for analyzing code structure and quality."""
 
+    def __init__(self):
+        # Content-addressed, so an edited file simply misses; results are frozen
+        self._results: "OrderedDict[bytes, CodeAnalysisResult]" = OrderedDict()
+
     async def analyze_code(self, params: CodeAnalysisParams) -> CodeAnalysisResult:
         """Analyze code structure and provide insights."""
-        code = params.code_content
-        file_path = params.file_path
-        
+        digest = hashlib.sha256(params.file_path.encode())
+        digest.update(b"\0")
+        digest.update(params.code_content.encode())
+        key = digest.digest()
+
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return cached
+
+        # Parsing and regex scans are CPU-bound; keep them off the event loop
+        result = await asyncio.to_thread(self._analyze, params.code_content, params.file_path)
+        self._results[key] = result
+        if len(self._results) > ANALYSIS_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
+
+    def _analyze(self, code: str, file_path: str) -> CodeAnalysisResult:
+        """Analyze code synchronously."""
         # Determine language from file extension
         language = self._detect_language(file_path)
         
         if language == "python":
-            return await self._analyze_python_code(code, file_path)
+            return self._analyze_python_code(code, file_path)
         else:
-            return await self._analyze_generic_code(code, file_path)
+            return self._analyze_generic_code(code, file_path)
 
     def _detect_language(self, file_path: str) -> str:
         """Detect programming language from file extension."""
@@ -51,22 +216,25 @@ class CodeAnalyzer:
         
         return language_map.get(extension, "generic")
 
-    async def _analyze_python_code(self, code: str, file_path: str) -> CodeAnalysisResult:
+    def _analyze_python_code(self, code: str, file_path: str) -> CodeAnalysisResult:
         """Analyze Python code using AST."""
         try:
             tree = ast.parse(code)
             
+            # Walk the tree once for everything below
+            collected = _PythonCollector(tree)
+            
             # Extract structure using AST
-            structure = self._extract_python_structure(tree)
+            structure = self._extract_python_structure(collected)
             
             # Calculate metrics
-            metrics = self._calculate_python_metrics(tree, code)
+            metrics = self._calculate_python_metrics(collected, code)
             
             # Generate suggestions
-            suggestions = self._generate_python_suggestions(tree, code)
+            suggestions = self._generate_python_suggestions(collected, code)
             
             # Detect patterns
-            patterns = self._detect_python_patterns(tree, code, file_path)
+            patterns = self._detect_python_patterns(collected)
             
             return CodeAnalysisResult(
                 structure=structure,
@@ -77,27 +245,12 @@ class CodeAnalyzer:
             
         except SyntaxError:
             # Fallback to generic analysis if Python parsing fails
-            return await self._analyze_generic_code(code, file_path)
+            return self._analyze_generic_code(code, file_path)
 
-    def _extract_python_structure(self, tree: ast.AST) -> CodeStructure:
-        """Extract Python code structure using AST."""
-        functions = []
-        classes = []
-        imports = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append(node.name)
-            elif isinstance(node, ast.AsyncFunctionDef):
-                functions.append(f"async {node.name}")
-            elif isinstance(node, ast.ClassDef):
-                classes.append(node.name)
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
+    def _extract_python_structure(self, collected: _PythonCollector) -> CodeStructure:
+        """Extract Python code structure from the collected AST facts."""
+        functions = collected.functions
+        classes = collected.classes
         
         # Python doesn't have explicit exports, so we'll identify public functions/classes
         exports = [name for name in functions + classes if not name.startswith('_')]
@@ -105,21 +258,20 @@ class CodeAnalyzer:
         return CodeStructure(
             functions=functions,
             classes=classes,
-            imports=imports,
+            imports=collected.imports,
             exports=exports
         )
 
-    def _calculate_python_metrics(self, tree: ast.AST, code: str) -> CodeMetrics:
+    def _calculate_python_metrics(self, collected: _PythonCollector, code: str) -> CodeMetrics:
         """Calculate code metrics for Python code."""
-        lines = [line.strip() for line in code.split('\n') if line.strip()]
-        lines_of_code = len(lines)
+        lines_of_code = sum(1 for line in code.splitlines() if line.strip())
         
-        # Calculate cyclomatic complexity
-        complexity = self._calculate_cyclomatic_complexity(tree)
+        # Cyclomatic complexity was counted during the walk
+        complexity = collected.complexity
         
         # Calculate maintainability score
         maintainability = self._calculate_maintainability_score(
-            lines_of_code, complexity, len(self._extract_python_structure(tree).functions)
+            lines_of_code, complexity, len(collected.functions)
         )
         
         return CodeMetrics(
@@ -128,124 +280,66 @@ class CodeAnalyzer:
             maintainability_score=maintainability
         )
 
-    def _calculate_cyclomatic_complexity(self, tree: ast.AST) -> int:
-        """Calculate cyclomatic complexity for Python AST."""
-        complexity = 1  # Base complexity
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, ast.With, ast.AsyncWith):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-        
-        return complexity
-
-    def _generate_python_suggestions(self, tree: ast.AST, code: str) -> List[str]:
+    def _generate_python_suggestions(self, collected: _PythonCollector, code: str) -> List[str]:
         """Generate improvement suggestions for Python code."""
-        suggestions = []
-        
-        # Check for long functions
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
-                    lines = node.end_lineno - node.lineno
-                    if lines > 50:
-                        suggestions.append(f"Function '{node.name}' is too long ({lines} lines). Consider breaking it down.")
-        
-        # Check for missing docstrings
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-                if not ast.get_docstring(node):
-                    suggestions.append(f"Add docstring to {node.__class__.__name__.lower()} '{node.name}'")
+        # Check for long functions and missing docstrings
+        suggestions = collected.long_functions + collected.missing_docstrings
         
         # Check for TODO/FIXME comments
         if "# TODO" in code or "# FIXME" in code:
             suggestions.append("Address TODO and FIXME comments")
         
         # Check for exception handling
-        has_try_except = any(isinstance(node, ast.Try) for node in ast.walk(tree))
-        has_async = any(isinstance(node, ast.AsyncFunctionDef) for node in ast.walk(tree))
-        
-        if has_async and not has_try_except:
+        if collected.has_async and not collected.has_try:
             suggestions.append("Consider adding error handling for async operations")
         
         # Check for type hints
-        functions_without_types = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if not node.returns and node.name != "__init__":
-                    functions_without_types.append(node.name)
-        
-        if functions_without_types:
+        if collected.has_untyped_function:
             suggestions.append("Consider adding type hints to improve code clarity")
         
         return suggestions
 
-    def _detect_python_patterns(self, tree: ast.AST, code: str, file_path: str) -> List[str]:
+    def _detect_python_patterns(self, collected: _PythonCollector) -> List[str]:
         """Detect Python patterns and frameworks."""
         patterns = []
         
-        # Check for common frameworks
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        
-        # Framework detection
-        if any("django" in imp for imp in imports):
-            patterns.append("Django Framework")
-        if any("flask" in imp for imp in imports):
-            patterns.append("Flask Framework")
-        if any("fastapi" in imp for imp in imports):
-            patterns.append("FastAPI Framework")
-        if any("pytest" in imp for imp in imports):
-            patterns.append("pytest Testing")
-        if any("numpy" in imp for imp in imports):
-            patterns.append("NumPy Data Processing")
-        if any("pandas" in imp for imp in imports):
-            patterns.append("Pandas Data Analysis")
-        if any("asyncio" in imp for imp in imports):
-            patterns.append("Asyncio Async Programming")
+        # Framework detection by the dotted and underscored parts of each import,
+        # so extensions such as flask_sqlalchemy or pytest_asyncio also count
+        name_parts = {part for imp in collected.imports for part in _IMPORT_NAME_SPLIT_RE.split(imp)}
+        patterns.extend(label for module, label in _FRAMEWORK_PATTERNS.items() if module in name_parts)
         
         # Pattern detection
-        if any(isinstance(node, ast.ClassDef) for node in ast.walk(tree)):
+        if collected.classes:
             patterns.append("Object-Oriented Programming")
         
-        if any(isinstance(node, ast.AsyncFunctionDef) for node in ast.walk(tree)):
+        if collected.has_async:
             patterns.append("Async/Await Pattern")
         
-        if any(isinstance(node, ast.With) for node in ast.walk(tree)):
+        if collected.has_with:
             patterns.append("Context Manager Pattern")
         
-        if any(isinstance(node, ast.ListComp) for node in ast.walk(tree)):
+        if collected.has_list_comp:
             patterns.append("List Comprehension")
         
-        if any(isinstance(node, ast.Lambda) for node in ast.walk(tree)):
+        if collected.has_lambda:
             patterns.append("Functional Programming")
         
         return patterns
 
-    async def _analyze_generic_code(self, code: str, file_path: str) -> CodeAnalysisResult:
+    def _analyze_generic_code(self, code: str, file_path: str) -> CodeAnalysisResult:
         """Analyze code using regex patterns for non-Python languages."""
-        lines = [line.strip() for line in code.split('\n') if line.strip()]
+        lines_of_code = sum(1 for line in code.splitlines() if line.strip())
         
         # Extract structure using regex
         structure = self._extract_generic_structure(code)
         
         # Calculate basic metrics
+        complexity = self._calculate_generic_complexity(code)
         metrics = CodeMetrics(
-            lines_of_code=len(lines),
-            complexity=self._calculate_generic_complexity(code),
+            lines_of_code=lines_of_code,
+            complexity=complexity,
             maintainability_score=self._calculate_maintainability_score(
-                len(lines), self._calculate_generic_complexity(code), len(structure.functions)
+                lines_of_code, complexity, len(structure.functions)
             )
         )
         
@@ -264,56 +358,23 @@ class CodeAnalyzer:
 
     def _extract_generic_structure(self, code: str) -> CodeStructure:
         """Extract code structure using regex patterns."""
-        # Function patterns for various languages
-        function_patterns = [
-            r'function\s+(\w+)',  # JavaScript
-            r'def\s+(\w+)',       # Python
-            r'const\s+(\w+)\s*=\s*(?:async\s+)?\(',  # JavaScript arrow functions
-            r'(\w+)\s*:\s*(?:async\s+)?\(',  # TypeScript
-            r'(?:public|private|protected)?\s*(?:static\s+)?(?:async\s+)?(?:\w+\s+)?(\w+)\s*\(',  # Java/C#
-        ]
-        
-        # Class patterns
-        class_patterns = [
-            r'class\s+(\w+)',
-            r'interface\s+(\w+)',
-            r'struct\s+(\w+)',
-            r'enum\s+(\w+)',
-        ]
-        
-        # Import patterns
-        import_patterns = [
-            r'import\s+(?:{[^}]+}|\w+|\*\s+as\s+\w+)\s+from\s+[\'"`]([^\'"`]+)[\'"`]',
-            r'from\s+(\w+)\s+import',
-            r'#include\s*<([^>]+)>',
-            r'using\s+(\w+);',
-        ]
-        
         functions = []
         classes = []
         imports = []
         
-        for pattern in function_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
-            functions.extend(matches)
+        for pattern in _FUNCTION_PATTERNS:
+            functions.extend(pattern.findall(code))
         
-        for pattern in class_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
-            classes.extend(matches)
+        for pattern in _CLASS_PATTERNS:
+            classes.extend(pattern.findall(code))
         
-        for pattern in import_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
-            imports.extend(matches)
+        for pattern in _IMPORT_PATTERNS:
+            imports.extend(pattern.findall(code))
         
         # Extract exports (simplified)
-        export_patterns = [
-            r'export\s+(?:default\s+)?(?:class\s+(\w+)|function\s+(\w+)|const\s+(\w+))',
-            r'module\.exports\s*=\s*(\w+)',
-        ]
-        
         exports = []
-        for pattern in export_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
+        for pattern in _EXPORT_PATTERNS:
+            matches = pattern.findall(code)
             for match in matches:
                 if isinstance(match, tuple):
                     exports.extend([m for m in match if m])
@@ -321,42 +382,41 @@ class CodeAnalyzer:
                     exports.append(match)
         
         return CodeStructure(
-            functions=list(set(functions)),
-            classes=list(set(classes)),
-            imports=list(set(imports)),
-            exports=list(set(exports))
+            functions=list(dict.fromkeys(functions)),
+            classes=list(dict.fromkeys(classes)),
+            imports=list(dict.fromkeys(imports)),
+            exports=list(dict.fromkeys(exports))
         )
 
     def _calculate_generic_complexity(self, code: str) -> int:
         """Calculate complexity using keyword counting."""
-        complexity_keywords = ['if', 'else', 'while', 'for', 'switch', 'case', 'catch', '&&', '||', '?']
-        complexity = 1
-        
-        for keyword in complexity_keywords:
-            complexity += len(re.findall(rf'\b{keyword}\b', code, re.IGNORECASE))
-        
-        return complexity
+        return 1 + sum(1 for _ in _COMPLEXITY_RE.finditer(code))
 
     def _generate_generic_suggestions(self, code: str) -> List[str]:
         """Generate suggestions for generic code."""
         suggestions = []
         
-        lines = code.split('\n')
-        if len(lines) > 200:
+        found = set()
+        for match in _SUGGESTION_RE.finditer(code):
+            found.add(match.lastgroup)
+            if len(found) == len(_SUGGESTION_GROUPS):
+                break
+        
+        if code.count('\n') + 1 > 200:
             suggestions.append("File is quite large. Consider breaking it into smaller modules.")
         
-        if 'TODO' in code or 'FIXME' in code:
+        if 'todo' in found:
             suggestions.append("Address TODO and FIXME comments")
         
-        if not re.search(r'\/\*\*|\*\/|\/\/', code):
+        if 'comment' not in found:
             suggestions.append("Add comments to improve code readability")
         
         # Check for console.log in JavaScript
-        if re.search(r'console\.log\(', code):
+        if 'console' in found:
             suggestions.append("Remove console.log statements before production")
         
         # Check for var usage in JavaScript
-        if re.search(r'\bvar\s+', code):
+        if 'var' in found:
             suggestions.append("Use const or let instead of var")
         
         return suggestions
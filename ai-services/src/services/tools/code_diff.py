@@ -1,4 +1,5 @@
 """Code diff generation service."""
+import asyncio
 import difflib
 from typing import List
 
@@ -10,17 +11,13 @@ class CodeDiffService:
 
     async def generate_diff(self, params: CodeDiffParams) -> CodeDiffResult:
         """Generate code diff between old and new code."""
-        old_lines = params.old_code.splitlines(keepends=True)
-        new_lines = params.new_code.splitlines(keepends=True)
-        
-        # Generate unified diff
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile="old_code",
-            tofile="new_code",
-            lineterm=""
-        )
+        # difflib is CPU-bound on large inputs; keep it off the event loop
+        return await asyncio.to_thread(self._generate_diff, params.old_code, params.new_code)
+
+    def _generate_diff(self, old_code: str, new_code: str) -> CodeDiffResult:
+        """Generate code diff synchronously."""
+        old_lines = old_code.splitlines(keepends=True)
+        new_lines = new_code.splitlines(keepends=True)
         
         # Parse diff and create structured result
         diffs: List[DiffLine] = []
@@ -28,34 +25,38 @@ class CodeDiffService:
         lines_removed = 0
         current_line_number = 1
         
-        # Use ndiff for better line-by-line comparison
-        ndiff = difflib.ndiff(old_lines, new_lines)
+        # Line-level opcodes from the same matcher ndiff uses, without its
+        # per-character hint pass over replaced blocks
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
         
-        for line in ndiff:
-            if line.startswith("  "):  # Unchanged line
-                diffs.append(DiffLine(
-                    type="unchanged",
-                    content=line[2:].rstrip("\n"),
-                    line_number=current_line_number
-                ))
-                current_line_number += 1
-            elif line.startswith("- "):  # Removed line
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":  # Unchanged lines
+                for line in new_lines[j1:j2]:
+                    diffs.append(DiffLine(
+                        type="unchanged",
+                        content=line.rstrip("\n"),
+                        line_number=current_line_number
+                    ))
+                    current_line_number += 1
+                continue
+            
+            # "delete" and "replace" remove lines; "insert" and "replace" add them
+            for line in old_lines[i1:i2]:
                 diffs.append(DiffLine(
                     type="removed",
-                    content=line[2:].rstrip("\n"),
+                    content=line.rstrip("\n"),
                     line_number=current_line_number
                 ))
-                lines_removed += 1
-            elif line.startswith("+ "):  # Added line
+            lines_removed += i2 - i1
+            
+            for line in new_lines[j1:j2]:
                 diffs.append(DiffLine(
                     type="added",
-                    content=line[2:].rstrip("\n"),
+                    content=line.rstrip("\n"),
                     line_number=current_line_number
                 ))
-                lines_added += 1
                 current_line_number += 1
-            elif line.startswith("? "):  # Diff hint - skip
-                continue
+            lines_added += j2 - j1
         
         # Calculate changed lines (minimum of added and removed)
         lines_changed = min(lines_added, lines_removed)
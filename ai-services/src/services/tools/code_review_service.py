@@ -9,6 +9,53 @@ from src.services.tools.security_analyzer import security_analyzer
 from src.services.tools.file_system import read_file
 
 
+def _compile_keyword_tiers(tiers: List[tuple]) -> "re.Pattern[str]":
+    """Compile ordered (label, keywords) tiers into one overlapping-match pattern.
+
+    Each alternative is a capture group in priority order, wrapped in a
+    lookahead so every position is tested; ``match.lastindex`` is the tier.
+    """
+    groups = "|".join(f"({'|'.join(map(re.escape, words))})" for _, words in tiers)
+    return re.compile(f"(?=(?:{groups}))")
+
+
+def _match_keyword_tier(text: str, pattern: "re.Pattern[str]", labels: List[str], default: str) -> str:
+    """Return the label of the highest-priority tier with a keyword in ``text``, in one scan."""
+    best = None
+    for match in pattern.finditer(text.lower()):
+        if best is None or match.lastindex < best:
+            best = match.lastindex
+            if best == 1:
+                break
+    return labels[best - 1] if best else default
+
+
+_SEVERITY_TIERS = [
+    ("critical", ["critical", "security", "vulnerability", "unsafe"]),
+    ("high", ["error", "exception", "bug", "fail"]),
+    ("medium", ["performance", "slow", "optimize"]),
+    ("low", ["style", "format", "comment", "doc"]),
+]
+_CATEGORY_TIERS = [
+    ("security", ["security", "vulnerability", "unsafe"]),
+    ("performance", ["performance", "slow", "optimize", "memory"]),
+    ("maintainability", ["maintain", "complex", "long", "break"]),
+    ("style", ["style", "format", "convention"]),
+    ("bug_risk", ["bug", "error", "exception"]),
+]
+_EFFORT_TIERS = [
+    ("high", ["refactor", "break", "extract", "restructure"]),
+    ("medium", ["add", "include", "implement"]),
+    ("low", ["remove", "fix", "address", "format"]),
+]
+SEVERITY_PATTERN = _compile_keyword_tiers(_SEVERITY_TIERS)
+CATEGORY_PATTERN = _compile_keyword_tiers(_CATEGORY_TIERS)
+EFFORT_PATTERN = _compile_keyword_tiers(_EFFORT_TIERS)
+SEVERITY_LABELS = [label for label, _ in _SEVERITY_TIERS]
+CATEGORY_LABELS = [label for label, _ in _CATEGORY_TIERS]
+EFFORT_LABELS = [label for label, _ in _EFFORT_TIERS]
+
+
 @dataclass
 class CodeReviewIssue:
     """Represents a code review issue."""
@@ -240,35 +287,11 @@ Focus on practical, implementable suggestions."""
 
     def _determine_severity_from_suggestion(self, suggestion: str) -> str:
         """Determine severity level from suggestion text."""
-        suggestion_lower = suggestion.lower()
-        
-        if any(word in suggestion_lower for word in ["critical", "security", "vulnerability", "unsafe"]):
-            return "critical"
-        elif any(word in suggestion_lower for word in ["error", "exception", "bug", "fail"]):
-            return "high"
-        elif any(word in suggestion_lower for word in ["performance", "slow", "optimize"]):
-            return "medium"
-        elif any(word in suggestion_lower for word in ["style", "format", "comment", "doc"]):
-            return "low"
-        else:
-            return "medium"
+        return _match_keyword_tier(suggestion, SEVERITY_PATTERN, SEVERITY_LABELS, "medium")
 
     def _categorize_suggestion(self, suggestion: str) -> str:
         """Categorize suggestion by type."""
-        suggestion_lower = suggestion.lower()
-        
-        if any(word in suggestion_lower for word in ["security", "vulnerability", "unsafe"]):
-            return "security"
-        elif any(word in suggestion_lower for word in ["performance", "slow", "optimize", "memory"]):
-            return "performance"
-        elif any(word in suggestion_lower for word in ["maintain", "complex", "long", "break"]):
-            return "maintainability"
-        elif any(word in suggestion_lower for word in ["style", "format", "convention"]):
-            return "style"
-        elif any(word in suggestion_lower for word in ["bug", "error", "exception"]):
-            return "bug_risk"
-        else:
-            return "maintainability"
+        return _match_keyword_tier(suggestion, CATEGORY_PATTERN, CATEGORY_LABELS, "maintainability")
 
     def _generate_fix_suggestion(self, suggestion: str) -> str:
         """Generate a specific fix suggestion."""
@@ -304,16 +327,7 @@ Focus on practical, implementable suggestions."""
 
     def _estimate_effort(self, suggestion: str) -> str:
         """Estimate effort required to fix the issue."""
-        suggestion_lower = suggestion.lower()
-        
-        if any(word in suggestion_lower for word in ["refactor", "break", "extract", "restructure"]):
-            return "high"
-        elif any(word in suggestion_lower for word in ["add", "include", "implement"]):
-            return "medium"  
-        elif any(word in suggestion_lower for word in ["remove", "fix", "address", "format"]):
-            return "low"
-        else:
-            return "medium"
+        return _match_keyword_tier(suggestion, EFFORT_PATTERN, EFFORT_LABELS, "medium")
 
     def _estimate_security_effort(self, severity: str) -> str:
         """Estimate effort for security fixes."""
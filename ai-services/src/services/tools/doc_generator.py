@@ -1,10 +1,13 @@
 import asyncio
+import logging
 from datetime import datetime
 from typing import Dict, List, Any
 
 from src.models.tools import DocumentationParams, MultiDocumentationParams, DocumentationResult, DocType
 from src.services.tools.file_system import write_file
 
+logger = logging.getLogger(__name__)
+
 
 class DocumentationService:
     """Service for generating technical documentation."""
@@ -68,11 +71,12 @@ class DocumentationService:
 
     async def generate_multiple_documentation(self, params: MultiDocumentationParams, working_directory: str = None) -> List[Dict]:
         """Generate multiple types of documentation in parallel."""
-        print(f"DEBUG: Generating multiple documentation in working directory: {working_directory}")
+        logger.debug("Generating multiple documentation in working directory: %s", working_directory)
         
         async def generate_and_write_doc(doc_type: DocType) -> Dict:
             try:
-                single_params = DocumentationParams(
+                # Every field comes from the validated params; skip re-validation
+                single_params = DocumentationParams.model_construct(
                     doc_type=doc_type,
                     project_context=params.project_context,
                     code_structure=params.code_structure
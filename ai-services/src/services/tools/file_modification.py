@@ -60,7 +60,8 @@ Requirements:
 
         # Generate diff between original and modified content
         from src.models.tools import CodeDiffParams
-        diff_params = CodeDiffParams(
+        # Both sides are strings produced here, so validation can be skipped
+        diff_params = CodeDiffParams.model_construct(
             old_code=current_content,
             new_code=modified_content,
             language=self._detect_language(params.file_path)
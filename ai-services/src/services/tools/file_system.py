@@ -1,14 +1,25 @@
+import asyncio
+import logging
 import os
+import threading
 from pathlib import Path
 import pathspec
 from pathspec.patterns import GitWildMatchPattern
 
-# Global .gitignore spec
+logger = logging.getLogger(__name__)
+
+# Global .gitignore spec; directory listings load it from worker threads, so
+# each load reads and assigns it under the lock
 GITIGNORE_SPEC = None
+_GITIGNORE_LOCK = threading.Lock()
 
 # Determine the repository root once
 REPO_ROOT = Path(os.getcwd())
 
+# Names checked for every entry of a directory walk; sets give O(1) lookups
+ALLOWED_HIDDEN_NAMES = frozenset({'.env'})
+IGNORED_NAMES = frozenset({'node_modules', '__pycache__', 'dist', 'build', '.git', '.next', 'coverage'})
+
 def get_validated_path(base_path: str, file_path: str) -> Path:
     if not base_path:
         raise ValueError("A working directory must be specified.")
@@ -33,24 +44,25 @@ class SecurityException(Exception):
 def load_gitignore(repo_root: Path):
     global GITIGNORE_SPEC
     gitignore_path = repo_root / ".gitignore"
-    if gitignore_path.exists():
-        with open(gitignore_path, "r") as f:
-            lines = f.readlines()
-            print(f"DEBUG: Gitignore lines: {lines}") # Added debug print
-            GITIGNORE_SPEC = pathspec.PathSpec.from_lines(GitWildMatchPattern, lines)
-    else:
-        GITIGNORE_SPEC = None
+    with _GITIGNORE_LOCK:
+        if gitignore_path.exists():
+            with open(gitignore_path, "r") as f:
+                lines = f.readlines()
+                logger.debug("Gitignore lines: %s", lines)
+                GITIGNORE_SPEC = pathspec.PathSpec.from_lines(GitWildMatchPattern, lines)
+        else:
+            GITIGNORE_SPEC = None
 
 def is_ignored(file_path: Path, repo_root: Path) -> bool:
     # Skip common system files and directories
     name = file_path.name
     
     # Skip hidden files (except .env)
-    if name.startswith('.') and name not in ['.env']:
+    if name.startswith('.') and name not in ALLOWED_HIDDEN_NAMES:
         return True
     
     # Skip common ignore patterns
-    if name in ['node_modules', '__pycache__', 'dist', 'build', '.git', '.next', 'coverage']:
+    if name in IGNORED_NAMES:
         return True
     
     # Skip log files and temp files
@@ -59,54 +71,98 @@ def is_ignored(file_path: Path, repo_root: Path) -> bool:
     
     return False
 
-async def list_directory(path: str) -> dict:
+def _build_tree(current_dir: Path, base_path: Path) -> list:
+    tree = []
+    try:
+        tree.extend(iter_entries(current_dir, base_path))
+    except Exception:
+        logger.exception("Error listing directory %s", current_dir)
+    return tree
+
+def _build_entry(item_path: Path, base_path: Path):
+    """Build one directory entry with its full subtree, or None if it is skipped."""
+    if is_ignored(item_path, base_path): # Check if ignored
+        return None
+
+    if item_path.is_dir():
+        # Recursively get children, but only if not ignored
+        children = _build_tree(item_path, base_path)
+        return {"name": item_path.name, "type": "directory", "children": children or []}
+    if item_path.is_file():
+        return {"name": item_path.name, "type": "file"}
+    return None
+
+def iter_entries(current_dir: Path, base_path: Path):
+    """Yield the entries of one directory level, each with its full subtree."""
+    for item in os.listdir(current_dir):
+        entry = _build_entry(current_dir / item, base_path)
+        if entry is not None:
+            yield entry
+
+def open_directory(path: str) -> Path:
+    """Resolve and validate a directory for listing, loading its .gitignore."""
     base_path = Path(path).resolve()
     if not base_path.is_dir():
-        return {"error": f"Invalid directory: {path}"}
-
+        raise ValueError(f"Invalid directory: {path}")
     load_gitignore(base_path)
+    return base_path
+
+def _list_top_level(path: str) -> tuple:
+    base_path = open_directory(path)
+    return base_path, os.listdir(base_path)
+
+async def _stream_entries(base_path: Path, names: list):
+    for item in names:
+        # Each subtree walk is blocking file system I/O; run it on a worker thread
+        entry = await asyncio.to_thread(_build_entry, base_path / item, base_path)
+        if entry is not None:
+            yield entry
+
+async def stream_directory(path: str):
+    """Open and list a directory, returning an iterator over its top-level entries.
+
+    Errors opening or listing the directory are raised here, before anything
+    is streamed; subtree errors are logged and skipped as in list_directory.
+    """
+    base_path, names = await asyncio.to_thread(_list_top_level, path)
+    return _stream_entries(base_path, names)
+
+async def list_directory(path: str) -> dict:
+    # Opening and walking are blocking file system I/O; run them on worker threads
+    try:
+        base_path = await asyncio.to_thread(open_directory, path)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    return {"tree": await asyncio.to_thread(_build_tree, base_path, base_path)}
+
+def _read_text(path: Path) -> str:
+    with open(path, 'r') as f:
+        return f.read()
 
-    def get_tree(current_dir: Path):
-        tree = []
-        try:
-            for item in os.listdir(current_dir):
-                item_path = current_dir / item
-                if is_ignored(item_path, base_path): # Check if ignored
-                    continue
-
-                if item_path.is_dir():
-                    # Recursively get children, but only if not ignored
-                    children = get_tree(item_path)
-                    tree.append({"name": item, "type": "directory", "children": children or []})
-                elif item_path.is_file():
-                    tree.append({"name": item, "type": "file"})
-        except Exception as e:
-            print(f"Error listing directory {current_dir}: {e}")
-        return tree
-
-    return {"tree": get_tree(base_path)}
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True) # Ensure directory exists
+    with open(path, 'w') as f:
+        f.write(content)
 
 async def read_file(absolute_path: str, base_path: str = None) -> dict:
     try:
         full_path = get_validated_path(base_path, absolute_path)
-        with open(full_path, 'r') as f:
-            content = f.read()
+        content = await asyncio.to_thread(_read_text, full_path)
         return {"content": content}
     except (ValueError, SecurityException) as e:
         return {"content": f"Error: {e}"}
     except Exception as e:
-        print(f"Error reading file {full_path}: {e}")
+        logger.exception("Error reading file %s", absolute_path)
         return {"content": f"Error reading file: {e}"}
 
 async def write_file(file_path: str, content: str, base_path: str = None) -> dict:
     try:
         full_path = get_validated_path(base_path, file_path)
-        full_path.parent.mkdir(parents=True, exist_ok=True) # Ensure directory exists
-        with open(full_path, 'w') as f:
-            f.write(content)
+        await asyncio.to_thread(_write_text, full_path, content)
         return {"success": True, "message": f"File {file_path} written successfully."}
     except (ValueError, SecurityException) as e:
         return {"success": False, "message": f"Error: {e}"}
     except Exception as e:
-        print(f"Error writing file {full_path}: {e}")
+        logger.exception("Error writing file %s", file_path)
         return {"success": False, "message": f"Error writing file: {e}"}
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Security vulnerability analyzer for code review."""
 import re
 import ast
+import asyncio
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -70,20 +71,22 @@ class SecurityAnalyzer:
 
     async def analyze_security(self, params: CodeAnalysisParams) -> SecurityAnalysisResult:
         """Perform comprehensive security analysis of code."""
-        code = params.code_content
-        file_path = params.file_path
-        
+        # Pattern scans are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self._analyze, params.code_content, params.file_path)
+
+    def _analyze(self, code: str, file_path: str) -> SecurityAnalysisResult:
+        """Analyze code security synchronously."""
         issues = []
         
         # Determine language and run appropriate analysis
         language = self._detect_language(file_path)
         
         if language == "python":
-            issues.extend(await self._analyze_python_security(code))
+            issues.extend(self._analyze_python_security(code))
         elif language in ["javascript", "typescript"]:
-            issues.extend(await self._analyze_javascript_security(code))
+            issues.extend(self._analyze_javascript_security(code))
         elif language == "java":
-            issues.extend(await self._analyze_java_security(code))
+            issues.extend(self._analyze_java_security(code))
         
         # Run general security checks
         issues.extend(self._analyze_general_security(code))
@@ -121,7 +124,7 @@ class SecurityAnalyzer:
         }
         return language_map.get(extension, "generic")
 
-    async def _analyze_python_security(self, code: str) -> List[SecurityIssue]:
+    def _analyze_python_security(self, code: str) -> List[SecurityIssue]:
         """Analyze Python-specific security issues."""
         issues = []
         lines = code.split('\n')
@@ -203,7 +206,7 @@ class SecurityAnalyzer:
         
         return issues
 
-    async def _analyze_javascript_security(self, code: str) -> List[SecurityIssue]:
+    def _analyze_javascript_security(self, code: str) -> List[SecurityIssue]:
         """Analyze JavaScript/TypeScript-specific security issues."""
         issues = []
         lines = code.split('\n')
@@ -250,7 +253,7 @@ class SecurityAnalyzer:
         
         return issues
 
-    async def _analyze_java_security(self, code: str) -> List[SecurityIssue]:
+    def _analyze_java_security(self, code: str) -> List[SecurityIssue]:
         """Analyze Java-specific security issues."""
         issues = []
         lines = code.split('\n')
@@ -17,10 +17,15 @@ from src.services.tools.file_modification import FileModificationService
 class SmartCodeActionService:
     """AI-powered service for smart code actions."""
 
-    def __init__(self, openai_provider: Any, claude_provider: Any):
+    def __init__(
+        self,
+        openai_provider: Any,
+        claude_provider: Any,
+        file_modification_service: Optional[FileModificationService] = None,
+    ):
         self.openai_provider = openai_provider
         self.claude_provider = claude_provider
-        self.file_modification_service = FileModificationService(openai_provider, claude_provider)
+        self.file_modification_service = file_modification_service or FileModificationService(openai_provider, claude_provider)
 
     async def perform_smart_action(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform smart code action based on natural language request."""
@@ -58,7 +63,7 @@ class SmartCodeActionService:
             "file_path": file_path,
             "action_request": action_request,
             "strategy_used": action_strategy,
-            "analysis": analysis_result.dict(),
+            "analysis": analysis_result.model_dump(),
             "result": result
         }
 
@@ -240,7 +245,7 @@ Common action patterns:
         return {
             "type": "refactor",
             "refactored_code": refactor_result.refactored_code,
-            "changes": [change.dict() for change in refactor_result.changes],
+            "changes": [change.model_dump() for change in refactor_result.changes],
             "improvements": refactor_result.improvements,
             "refactor_type": refactor_result.refactor_type
         }
@@ -262,7 +267,7 @@ Common action patterns:
             "type": "modify",
             "original_content": result.original_content,
             "modified_content": result.modified_content,
-            "diff": result.diff.dict(),
+            "diff": result.diff.model_dump(),
             "summary": result.modification_summary
         }
 
@@ -284,7 +289,7 @@ Common action patterns:
                 "type": "documentation",
                 "original_content": result.original_content,
                 "modified_content": result.modified_content,
-                "diff": result.diff.dict(),
+                "diff": result.diff.model_dump(),
                 "summary": result.modification_summary
             }
         else:
@@ -333,8 +338,8 @@ Common action patterns:
         """Execute general analysis strategy."""
         return {
             "type": "analysis",
-            "structure": analysis_result.structure.dict(),
-            "metrics": analysis_result.metrics.dict(),
+            "structure": analysis_result.structure.model_dump(),
+            "metrics": analysis_result.metrics.model_dump(),
             "suggestions": analysis_result.suggestions,
             "patterns": analysis_result.patterns,
             "recommendations": [
@@ -0,0 +1,61 @@
+"""Tests for the code analysis service."""
+from src.models.tools import CodeAnalysisParams
+from src.services.tools.code_analyzer import CodeAnalyzer
+
+PYTHON_SOURCE = '''\
+import asyncio
+from contextlib import suppress
+
+
+async def drain(queue, lock):
+    """Collect queued items that are ready or forced."""
+    ready = []
+    async with lock:
+        while not queue.empty():
+            item = await queue.get()
+            if item.ready and not item.skip or item.forced:
+                with suppress(KeyError):
+                    ready.append(item["key"])
+    return ready
+'''
+
+
+async def test_python_complexity_counts_with_blocks_and_bool_ops():
+    result = await CodeAnalyzer().analyze_code(
+        CodeAnalysisParams(file_path="drain.py", code_content=PYTHON_SOURCE)
+    )
+
+    # 1 base + async with + while + if + or + and + with
+    assert result.metrics.complexity == 7
+    assert result.structure.functions == ["async drain"]
+    assert result.structure.imports == ["asyncio", "contextlib"]
+    assert "Context Manager Pattern" in result.patterns
+    assert "Async/Await Pattern" in result.patterns
+
+
+JAVASCRIPT_SOURCE = '''\
+// Display name shown in the header
+import React from 'react';
+
+export function label(user) {
+  if (user && user.admin || user.owner) {
+    return user.name ? user.name : 'admin';
+  } else {
+    return 'guest';
+  }
+}
+'''
+
+
+async def test_generic_analysis_counts_operator_branches():
+    result = await CodeAnalyzer().analyze_code(
+        CodeAnalysisParams(file_path="label.js", code_content=JAVASCRIPT_SOURCE)
+    )
+
+    # 1 base + if + && + || + ? + else
+    assert result.metrics.complexity == 6
+    assert "label" in result.structure.functions
+    assert result.structure.imports == ["react"]
+    assert result.structure.exports == ["label"]
+    assert result.patterns[:2] == ["JavaScript", "React Framework"]
+    assert "Add comments to improve code readability" not in result.suggestions
@@ -0,0 +1,62 @@
+"""Tests for the code diff service."""
+from src.models.tools import CodeDiffParams
+from src.services.tools.code_diff import CodeDiffService
+
+OLD_CODE = """\
+def area(width, height):
+    total = width * height
+    print(total)
+    return total
+"""
+
+NEW_CODE = """\
+def area(width: float, height: float) -> float:
+    \"\"\"Return the rectangle's area.\"\"\"
+    total = width * height
+    return total
+
+
+def perimeter(width, height):
+    return 2 * (width + height)
+"""
+
+
+async def test_diff_lines_follow_the_matcher_opcodes():
+    result = await CodeDiffService().generate_diff(CodeDiffParams(old_code=OLD_CODE, new_code=NEW_CODE))
+
+    assert [(line.type, line.content, line.line_number) for line in result.diffs] == [
+        ("removed", "def area(width, height):", 1),
+        ("added", "def area(width: float, height: float) -> float:", 1),
+        ("added", '    """Return the rectangle\'s area."""', 2),
+        ("unchanged", "    total = width * height", 3),
+        ("removed", "    print(total)", 4),
+        ("unchanged", "    return total", 4),
+        ("added", "", 5),
+        ("added", "", 6),
+        ("added", "def perimeter(width, height):", 7),
+        ("added", "    return 2 * (width + height)", 8),
+    ]
+    assert result.summary.lines_added == 6
+    assert result.summary.lines_removed == 2
+    assert result.summary.lines_changed == 2
+
+
+def test_replaced_block_lists_removed_lines_before_added_lines():
+    old = "a = 1\nb = 2\nc = 3\n"
+    new = "a = 10\nb = 20\nc = 3\n"
+
+    result = CodeDiffService()._generate_diff(old, new)
+
+    assert [line.type for line in result.diffs] == ["removed", "removed", "added", "added", "unchanged"]
+    # Every old line is either kept or removed, and every new line kept or added
+    assert [line.content for line in result.diffs if line.type != "added"] == old.splitlines()
+    assert [line.content for line in result.diffs if line.type != "removed"] == new.splitlines()
+    assert [line.line_number for line in result.diffs if line.type != "removed"] == [1, 2, 3]
+
+
+def test_identical_code_has_no_changes():
+    result = CodeDiffService()._generate_diff(OLD_CODE, OLD_CODE)
+
+    assert all(line.type == "unchanged" for line in result.diffs)
+    assert len(result.diffs) == 4
+    assert (result.summary.lines_added, result.summary.lines_removed, result.summary.lines_changed) == (0, 0, 0)
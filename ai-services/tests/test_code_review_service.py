@@ -0,0 +1,81 @@
+"""Tests for the code review keyword classifiers."""
+import pytest
+
+from src.services.tools.code_review_service import (
+    CATEGORY_LABELS,
+    CATEGORY_PATTERN,
+    EFFORT_LABELS,
+    EFFORT_PATTERN,
+    SEVERITY_LABELS,
+    SEVERITY_PATTERN,
+    _CATEGORY_TIERS,
+    _EFFORT_TIERS,
+    _SEVERITY_TIERS,
+    _match_keyword_tier,
+)
+
+CLASSIFIERS = [
+    (_SEVERITY_TIERS, SEVERITY_PATTERN, SEVERITY_LABELS, "medium"),
+    (_CATEGORY_TIERS, CATEGORY_PATTERN, CATEGORY_LABELS, "maintainability"),
+    (_EFFORT_TIERS, EFFORT_PATTERN, EFFORT_LABELS, "medium"),
+]
+
+
+def _keyword_ladder(tiers, text, default):
+    """The any() chain the single-pass matcher replaced."""
+    text = text.lower()
+    for label, words in tiers:
+        if any(word in text for word in words):
+            return label
+    return default
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Fix the unsafe eval call", "critical"),
+        ("Handle the exception when parsing fails", "high"),
+        ("Optimize this loop", "medium"),
+        ("Add a docstring", "low"),
+        ("Rename variable", "medium"),
+    ],
+)
+def test_severity_tiers(text, expected):
+    assert _match_keyword_tier(text, SEVERITY_PATTERN, SEVERITY_LABELS, "medium") == expected
+
+
+def test_lower_tier_keyword_earlier_in_text_does_not_win():
+    text = "Style nit, but this is also a security vulnerability"
+    assert _match_keyword_tier(text, SEVERITY_PATTERN, SEVERITY_LABELS, "medium") == "critical"
+
+
+@pytest.mark.parametrize(
+    "text, pattern, labels, expected",
+    [
+        # "critical" starts on the last letters of "doc"
+        ("docritical", SEVERITY_PATTERN, SEVERITY_LABELS, "critical"),
+        # "error" starts on the last letter of "style"
+        ("stylerror", SEVERITY_PATTERN, SEVERITY_LABELS, "high"),
+        # "extract" starts on the last letter of "remove"
+        ("removextract", EFFORT_PATTERN, EFFORT_LABELS, "high"),
+    ],
+)
+def test_overlapping_keywords_are_all_seen(text, pattern, labels, expected):
+    # A consuming scan would match the lower tier keyword and skip past the
+    # start of the higher tier one; the lookahead tries every position
+    assert _match_keyword_tier(text, pattern, labels, "medium") == expected
+
+
+@pytest.mark.parametrize("tiers, pattern, labels, default", CLASSIFIERS)
+def test_matches_keyword_ladder(tiers, pattern, labels, default):
+    words = [word for _, tier_words in tiers for word in tier_words]
+    samples = [
+        "",
+        "nothing relevant here",
+        " ".join(words),
+        " ".join(reversed(words)),
+        "".join(words),
+        "".join(reversed(words)),
+    ] + [f"prefix {word.upper()} suffix" for word in words]
+    for text in samples:
+        assert _match_keyword_tier(text, pattern, labels, default) == _keyword_ladder(tiers, text, default), text
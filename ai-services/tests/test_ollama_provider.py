@@ -0,0 +1,79 @@
+"""Tests for the Ollama provider's NDJSON reader and delta coalescing."""
+import asyncio
+
+import pytest
+
+from src.services.providers import ollama_provider
+from src.services.providers.ollama_provider import OllamaProvider, _DeltaCoalescer
+
+
+class FakeContent:
+    """Stands in for aiohttp's StreamReader, replaying fixed chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunks(self):
+        for chunk in self._chunks:
+            yield chunk, True
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.content = FakeContent(chunks)
+
+
+async def read_lines(chunks):
+    return [line async for line in OllamaProvider._iter_ndjson(FakeResponse(chunks))]
+
+
+async def test_lines_split_across_chunks():
+    chunks = [b'{"a":', b' 1}\n{"b": 2', b"}\n", b"\n", b'{"c": 3}\n{"d"', b": 4}"]
+
+    assert await read_lines(chunks) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}', b'{"d": 4}']
+
+
+async def test_several_lines_in_one_chunk_and_blank_lines_skipped():
+    chunks = [b'{"a": 1}\n\n  \n{"b": 2}\r\n{"c": 3}\n']
+
+    assert await read_lines(chunks) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+async def test_complete_line_over_max_line_is_rejected(monkeypatch):
+    monkeypatch.setattr(ollama_provider, "MAX_LINE", 8)
+
+    assert await read_lines([b"12345678\n"]) == [b"12345678"]
+    with pytest.raises(ValueError, match="exceeds 8 bytes"):
+        await read_lines([b"ok\n123456789\n"])
+
+
+async def test_partial_line_over_max_line_is_rejected(monkeypatch):
+    monkeypatch.setattr(ollama_provider, "MAX_LINE", 8)
+
+    # The newline never arrives, so the cap has to apply to the pending buffer
+    with pytest.raises(ValueError, match="exceeds 8 bytes"):
+        await read_lines([b"12345", b"6789", b"0123"])
+
+
+async def test_paced_flushes_buffered_text_while_upstream_stalls():
+    release = asyncio.Event()
+
+    async def lines():
+        yield b"first"
+        await release.wait()
+        yield b"second"
+
+    coalescer = _DeltaCoalescer()
+    seen = []
+    async for line in coalescer.paced(lines()):
+        if line is None:
+            seen.append(coalescer.flush())
+            release.set()
+            continue
+        seen.append(line)
+        if line == b"first":
+            # The first delta goes out immediately, the second is buffered
+            assert coalescer.add("a") == "a"
+            assert coalescer.add("b") is None
+
+    assert seen == [b"first", "b", b"second"]
@@ -0,0 +1,121 @@
+"""Tests for the chat route's server-sent events response."""
+import asyncio
+import gc
+
+from src.routes.sse import PING_FRAME, EventStreamResponse
+
+
+class FakeClient:
+    """ASGI receive/send pair that records body frames and can disconnect."""
+
+    def __init__(self):
+        self.disconnected = asyncio.Event()
+        self.bodies = []
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if self.disconnected.is_set():
+            raise OSError("client disconnected")
+        if message["type"] == "http.response.body":
+            self.bodies.append(message["body"])
+
+
+async def test_streams_frames_then_ends_body():
+    async def frames():
+        for i in range(3):
+            yield b"data: %d\n\n" % i
+
+    client = FakeClient()
+    await EventStreamResponse(frames())(None, client.receive, client.send)
+
+    assert client.bodies == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n", b""]
+
+
+async def test_disconnect_cancels_stalled_producer():
+    events = []
+
+    async def frames():
+        try:
+            yield b"data: 1\n\n"
+            await asyncio.sleep(3600)  # Upstream stalls without producing a frame
+            yield b"data: 2\n\n"
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        finally:
+            events.append("closed")
+
+    client = FakeClient()
+    response = asyncio.ensure_future(EventStreamResponse(frames())(None, client.receive, client.send))
+    await asyncio.sleep(0.05)
+    client.disconnected.set()
+
+    await asyncio.wait_for(response, timeout=1)
+    assert events == ["cancelled", "closed"]
+    assert client.bodies == [b"data: 1\n\n"]
+
+
+async def test_pings_never_overlap_frame_sends():
+    in_send = False
+    overlaps = 0
+    bodies = []
+
+    async def send(message):
+        nonlocal in_send, overlaps
+        if in_send:
+            overlaps += 1
+        in_send = True
+        await asyncio.sleep(0.01)  # A slow transport keeps each send pending
+        in_send = False
+        if message["type"] == "http.response.body":
+            bodies.append(message["body"])
+
+    async def receive():
+        await asyncio.sleep(3600)
+
+    async def frames():
+        for _ in range(10):
+            await asyncio.sleep(0.005)
+            yield b"data: x\n\n"
+
+    await EventStreamResponse(frames(), ping_interval=0.002)(None, receive, send)
+
+    assert overlaps == 0
+    assert PING_FRAME in bodies
+    assert bodies[-1] == b""
+
+
+async def test_pinger_error_after_disconnect_is_retrieved():
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    async def frames():
+        await asyncio.sleep(3600)
+        yield b"data: never\n\n"
+
+    client = FakeClient()
+    broken = False
+
+    async def send(message):
+        # The transport fails before the server reports the disconnect
+        if broken:
+            raise OSError("connection reset")
+        await client.send(message)
+
+    response = asyncio.ensure_future(
+        EventStreamResponse(frames(), ping_interval=0.01)(None, client.receive, send)
+    )
+    await asyncio.sleep(0.005)
+    broken = True
+    await asyncio.sleep(0.03)  # The pinger's next send raises OSError
+    client.disconnected.set()
+    await asyncio.wait_for(response, timeout=1)
+
+    gc.collect()
+    await asyncio.sleep(0)
+    loop.set_exception_handler(None)
+    assert errors == []